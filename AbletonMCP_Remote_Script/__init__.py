@@ -375,6 +375,8 @@ class AbletonMCP(ControlSurface):
                 "set_track_monitoring_state",
                 "load_browser_item",
                 "get_device_parameters",
+                "get_device_parameter_values",
+                "batch_get_device_parameter_values",
                 "set_device_parameter",
                 "add_automation_point",
                 "clear_automation",
@@ -560,6 +562,15 @@ class AbletonMCP(ControlSurface):
                             result = self._get_device_parameters(
                                 track_index, device_index
                             )
+                        elif command_type == "get_device_parameter_values":
+                            track_index = params.get("track_index", 0)
+                            device_index = params.get("device_index", 0)
+                            result = self._get_device_parameter_values(
+                                track_index, device_index
+                            )
+                        elif command_type == "batch_get_device_parameter_values":
+                            calls = params.get("calls", [])
+                            result = self._batch_get_device_parameter_values(calls)
                         elif command_type == "set_device_parameter":
                             track_index = params.get("track_index", 0)
                             device_index = params.get("device_index", 0)
@@ -1597,6 +1608,42 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error getting device parameters: " + str(e))
             raise
 
+    def _get_device_parameter_values(self, track_index, device_index):
+        """Get just the parameter values of a device, in device parameter order"""
+        try:
+            if track_index < 0 or track_index >= len(self._song.tracks):
+                raise IndexError("Track index out of range")
+
+            track = self._song.tracks[track_index]
+
+            if device_index < 0 or device_index >= len(track.devices):
+                raise IndexError("Device index out of range")
+
+            device = track.devices[device_index]
+
+            # Plain floats indexed like device.parameters, for fast polling
+            values = [param.value for param in getattr(device, "parameters", [])]
+
+            return {"device_index": device_index, "values": values}
+        except Exception as e:
+            self.log_message("Error getting device parameter values: " + str(e))
+            raise
+
+    def _batch_get_device_parameter_values(self, calls):
+        """Get the parameter values of several devices in one command"""
+        results = []
+        for call in calls:
+            try:
+                results.append(
+                    self._get_device_parameter_values(
+                        call.get("track_index", 0), call.get("device_index", 0)
+                    )
+                )
+            except Exception as e:
+                # One missing device must not fail the whole batch
+                results.append({"error": str(e)})
+        return {"results": results}
+
     def _set_device_parameter(self, track_index, device_index, parameter_index, value):
         """Set a device parameter value (normalized 0.0-1.0)"""
         try:
@@ -35,6 +35,7 @@ Usage:
 from .polling import (
     ParameterConfig,
     ParameterSnapshot,
+    ParameterValues,
     CircularBuffer,
     AudioAnalysisPoller,
     MultiPluginPoller,
@@ -65,6 +66,7 @@ __all__ = [
     # Polling
     "ParameterConfig",
     "ParameterSnapshot",
+    "ParameterValues",
     "CircularBuffer",
     "AudioAnalysisPoller",
     "MultiPluginPoller",
@@ -19,7 +19,9 @@ from typing import List, Dict, Optional, Callable, Any
 from contextlib import contextmanager
 import statistics
 
-from .polling import AudioParameterPoller
+import numpy as np
+
+from .polling import AudioAnalysisPoller
 from .rules import RuleEngine
 
 
@@ -75,9 +77,12 @@ class BenchmarkResult:
         cls, name: str, values: List[float], **metadata
     ) -> "BenchmarkResult":
         """Create BenchmarkResult from raw values."""
-        if not values:
+        if len(values) == 0:
             raise ValueError("No values provided")
 
+        # Plain Python floats, whatever the collector's dtype (e.g. float32
+        # CPU samples), so every statistic stays JSON-serializable
+        values = np.asarray(values, dtype=np.float64).tolist()
         sorted_values = sorted(values)
         n = len(values)
 
@@ -102,20 +107,45 @@ class BenchmarkResult:
 
 
 class DataCollector:
-    """Collects benchmark data over time."""
+    """Collects benchmark data over time.
+
+    Samples are stored in pre-allocated float64 arrays that grow by doubling
+    up to ``max_size``; once full, the oldest samples are overwritten in place
+    (ring buffer) so memory stays bounded.
+    """
 
-    def __init__(self, max_size: int = 100000):
+    def __init__(
+        self,
+        max_size: int = 100000,
+        initial_capacity: int = 1024,
+        dtype: Any = np.float64,
+    ):
         """
         Initialize data collector.
 
         Args:
             max_size: Maximum number of samples to retain
+            initial_capacity: Number of samples to pre-allocate
+            dtype: Numpy dtype used to store sample values
         """
-        self.values: List[float] = []
-        self.timestamps: List[float] = []
         self.max_size = max_size
+        capacity = max(1, min(initial_capacity, max_size))
+        self._values = np.empty(capacity, dtype=dtype)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._n = 0  # Number of valid samples
+        self._head = 0  # Index of the oldest sample once the buffer wraps
         self.lock = threading.Lock()
 
+    def _grow(self) -> None:
+        """Double the buffer capacity (capped at max_size)."""
+        capacity = min(len(self._values) * 2, self.max_size)
+        values = np.empty(capacity, dtype=self._values.dtype)
+        timestamps = np.empty(capacity, dtype=np.float64)
+        values[: self._n] = self._values[: self._n]
+        timestamps[: self._n] = self._timestamps[: self._n]
+        self._values = values
+        self._timestamps = timestamps
+
     def add_sample(self, value: float, timestamp: float = None) -> None:
         """
         Add a sample to the collector.
@@ -128,71 +158,73 @@ class DataCollector:
             timestamp = time.time()
 
         with self.lock:
-            self.values.append(value)
-            self.timestamps.append(timestamp)
-
-            # Trim if exceeds max size
-            if len(self.values) > self.max_size:
-                self.values = self.values[-self.max_size :]
-                self.timestamps = self.timestamps[-self.max_size :]
-
-    def get_all_values(self) -> List[float]:
+            if self._n < self.max_size:
+                if self._n == len(self._values):
+                    self._grow()
+                self._values[self._n] = value
+                self._timestamps[self._n] = timestamp
+                self._n += 1
+            else:
+                # Full: overwrite the oldest sample
+                self._values[self._head] = value
+                self._timestamps[self._head] = timestamp
+                self._head = (self._head + 1) % self.max_size
+
+    def _ordered(self, buf: np.ndarray) -> np.ndarray:
+        """Return a chronologically ordered copy of the valid samples."""
+        if self._head == 0:
+            return buf[: self._n].copy()
+        return np.concatenate((buf[self._head :], buf[: self._head]))
+
+    def get_all_values(self) -> np.ndarray:
         """Get all collected values (thread-safe)."""
         with self.lock:
-            return self.values.copy()
+            return self._ordered(self._values)
 
-    def get_all_timestamps(self) -> List[float]:
+    def get_all_timestamps(self) -> np.ndarray:
         """Get all timestamps (thread-safe)."""
         with self.lock:
-            return self.timestamps.copy()
+            return self._ordered(self._timestamps)
 
     def clear(self) -> None:
         """Clear all collected data."""
         with self.lock:
-            self.values.clear()
-            self.timestamps.clear()
+            self._n = 0
+            self._head = 0
 
     def size(self) -> int:
         """Get number of samples collected."""
         with self.lock:
-            return len(self.values)
+            return self._n
 
 
 class CPUMonitor:
     """Monitors CPU usage over time."""
 
-    def __init__(self, interval: float = 0.1):
+    def __init__(self, interval: float = 0.1, max_samples: int = 100000):
         """
         Initialize CPU monitor.
 
         Args:
             interval: Sampling interval in seconds
+            max_samples: Maximum number of CPU samples to retain
         """
         self.interval = interval
         self.process = psutil.Process()
-        self.collector = DataCollector()
+        self.collector = DataCollector(max_size=max_samples, dtype=np.float32)
         self.running = False
         self.thread = None
         self.lock = threading.Lock()
 
     def _monitor_loop(self) -> None:
         """Background monitoring loop."""
-        process = psutil.Process()
+        process = self.process
         collector = self.collector
 
         while self.running:
             try:
-                # Get CPU percentage since last call
-                cpu_percent = process.cpu_percent(interval=None)
-
-                # Get memory usage
-                mem_info = process.memory_info()
-                mem_info.rss / (1024 * 1024)
-
-                # Store both metrics (store combined metric: cpu + 100 * mem_mb_factor)
-                # This keeps them in same collector for simplicity
-                # For now, just track CPU
-                collector.add_sample(cpu_percent, time.time())
+                # CPU percentage since the previous call (non-blocking delta)
+                collector.add_sample(process.cpu_percent(interval=None), time.time())
 
                 time.sleep(self.interval)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -205,6 +237,9 @@ class CPUMonitor:
             if self.running:
                 return
 
+        # Prime the delta counter so the first sample is meaningful
+        self.process.cpu_percent(interval=None)
+
         self.running = True
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
@@ -221,11 +256,11 @@ class CPUMonitor:
             self.thread.join(timeout=2.0)
             self.thread = None
 
-    def get_cpu_values(self) -> List[float]:
+    def get_cpu_values(self) -> np.ndarray:
         """Get all CPU usage samples."""
         return self.collector.get_all_values()
 
-    def get_timestamps(self) -> List[float]:
+    def get_timestamps(self) -> np.ndarray:
         """Get all sample timestamps."""
         return self.collector.get_all_timestamps()
 
@@ -252,6 +287,12 @@ class LatencyTimer:
         self.end_time: Optional[float] = None
         self.stages: Dict[str, float] = {}
 
+    def reset(self) -> None:
+        """Reset the timer in place so it can be reused without reallocating."""
+        self.start_time = None
+        self.end_time = None
+        self.stages.clear()
+
     def start(self) -> None:
         """Start timing."""
         self.start_time = time.perf_counter()
@@ -369,7 +410,7 @@ class BenchmarkSuite:
 
     def polling_rate_benchmark(
         self,
-        poller: AudioParameterPoller,
+        poller: AudioAnalysisPoller,
         target_rate_hz: int,
         duration_seconds: float = 10.0,
         param_indices: Optional[List[int]] = None,
@@ -378,7 +419,7 @@ class BenchmarkSuite:
         Benchmark the polling rate accuracy and stability.
 
         Args:
-            poller: AudioParameterPoller instance (or mock)
+            poller: AudioAnalysisPoller instance (or mock)
             target_rate_hz: Target polling rate in Hz
             duration_seconds: Benchmark duration
             param_indices: Parameter indices to poll
@@ -484,9 +525,10 @@ class BenchmarkSuite:
             BenchmarkResult with latency statistics
         """
         latencies = []
+        timer = LatencyTimer()
 
         for _ in range(poll_iterations):
-            timer = LatencyTimer()
+            timer.reset()
             timer.start()
 
             # Simulate control loop steps
@@ -13,12 +13,56 @@ Features:
 - Keyboard shortcuts (pause, quit, toggle debug)
 """
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+import functools
+import os
+import re
+from typing import Any, Callable, Dict, List, Mapping, Optional
 from datetime import datetime
+import shutil
+import sys
 import time
 import threading
 
+import numpy as np
+
+from .polling import ParameterValues
+
+# Optional JIT compiler for the per-frame color band classifier
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @njit("int8[:](float64[:])", cache=True)
+    def classify_bands(values):
+        """Color band per normalized value: 0 (<0.4), 1, 2, 3 (>=0.8)"""
+        bands = np.zeros(values.size, dtype=np.int8)
+        for i in range(values.size):
+            v = values[i]
+            if v >= 0.8:
+                bands[i] = 3
+            elif v >= 0.6:
+                bands[i] = 2
+            elif v >= 0.4:
+                bands[i] = 1
+        return bands
+
+else:
+
+    def classify_bands(values):
+        """Color band per normalized value: 0 (<0.4), 1, 2, 3 (>=0.8)"""
+        bands = (values >= 0.4).astype(np.int8)
+        bands += values >= 0.6
+        bands += values >= 0.8
+        return bands
+
 
 class MonitorColors:
     """ANSI color codes for terminal rendering."""
@@ -43,6 +87,47 @@ class MonitorColors:
     BG_YELLOW = "\033[43m"
 
 
+# Value color per band from classify_bands
+_BAND_COLORS = (
+    MonitorColors.DIM,
+    MonitorColors.GREEN,
+    MonitorColors.YELLOW,
+    MonitorColors.RED,
+)
+
+# SGR color sequences, which take no space on screen
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def visible_len(text: str) -> int:
+    """Number of terminal columns ``text`` occupies (ANSI codes excluded)."""
+    return len(_ANSI_RE.sub("", text))
+
+
+def truncate_visible(text: str, width: int) -> str:
+    """Cut ``text`` to ``width`` visible columns, keeping its ANSI codes."""
+    if len(text) <= width:  # Raw length bounds the visible length
+        return text
+    parts = []
+    remaining = width
+    pos = 0
+    for match in _ANSI_RE.finditer(text):
+        chunk = text[pos : match.start()]
+        if len(chunk) >= remaining:
+            break
+        parts.append(chunk)
+        parts.append(match.group())
+        remaining -= len(chunk)
+        pos = match.end()
+    else:
+        chunk = text[pos:]
+        if len(chunk) <= remaining:
+            return text
+    parts.append(chunk[:remaining])
+    parts.append(MonitorColors.RESET)  # Don't leak an open color past the cut
+    return "".join(parts)
+
+
 @dataclass
 class MonitorConfig:
     """Configuration for monitoring display."""
@@ -65,16 +150,68 @@ class MonitorDisplay:
 
     def __init__(self, config: Optional[MonitorConfig] = None):
         self.config = config or MonitorConfig()
-        self._last_reresh_time: float = 0.0
+        self._last_refresh_time: float = 0.0
+        # Lines of the frame currently on screen (empty: repaint everything)
+        self._prev_lines: List[str] = []
+        self._terminal_size = None
+        # Terminal fd frames are written to directly (None: use sys.stdout)
+        self._stdout_fd: Optional[int] = None
+
+        # Progress bar strings indexed by filled cells (rebuilt on width change)
+        self._bar_table: List[str] = []
+
+        # Rows are pure functions of their arguments, which are rounded to
+        # display precision first (see _cached_row), so steady parameters
+        # reuse their formatted string. Rebuilt when the bar width changes.
+        self._row_width = -1
+        self._row_cache: Optional[Callable[..., str]] = None
+        self._build_row_formatter()
+
+    def _progress_bars(self) -> List[str]:
+        """Return every possible progress bar for the configured width."""
+        width = self.config.progress_bar_width
+        if len(self._bar_table) != width + 1:
+            self._bar_table = [
+                MonitorColors.BG_GREEN
+                + " " * filled
+                + MonitorColors.RESET
+                + " " * (width - filled)
+                for filled in range(width + 1)
+            ]
+        return self._bar_table
 
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
         print("\033[2J\033[H", end="")
+        self._prev_lines = []
+
+    def attach_terminal(self) -> None:
+        """
+        Write frames straight to the stdout fd when it is a terminal.
+
+        Skips the TextIOWrapper (lock, codec, buffer) on every frame. Piped
+        or redirected output keeps going through sys.stdout.
+        """
+        try:
+            if sys.stdout.isatty():
+                sys.stdout.flush()  # Anything already buffered goes first
+                self._stdout_fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._stdout_fd = None
+
+    def detach_terminal(self) -> None:
+        """Go back to writing frames through sys.stdout."""
+        self._stdout_fd = None
 
     def move_cursor(self, row: int, col: int) -> None:
         """Move cursor to specific row and column."""
         print(f"\033[{row};{col}H", end="")
 
+    def cache_info(self) -> Dict[str, tuple]:
+        """Hit/miss statistics of the renderer caches (for debugging)."""
+        self._build_row_formatter()
+        return {"parameter_row": self._row_cache.cache_info()}
+
     def render_header(self, title: str) -> str:
         """Render section header."""
         line = MonitorColors.BOLD + MonitorColors.CYAN
@@ -109,37 +246,88 @@ class MonitorDisplay:
         """
         # Color based on value level
         if normalized_value >= 0.8:
-            value_color = MonitorColors.RED
+            band = 3
         elif normalized_value >= 0.6:
-            value_color = MonitorColors.YELLOW
+            band = 2
         elif normalized_value >= 0.4:
-            value_color = MonitorColors.GREEN
+            band = 1
         else:
-            value_color = MonitorColors.DIM
-
-        # Progress bar
-        bar_filled = int(normalized_value * self.config.progress_bar_width)
-        bar_empty = self.config.progress_bar_width - bar_filled
-        progress_bar = (
-            MonitorColors.BG_GREEN
-            + " " * bar_filled
-            + MonitorColors.RESET
-            + " " * bar_empty
+            band = 0
+        width = self.config.progress_bar_width
+        filled = normalized_value * width
+        filled = int(min(max(filled, 0), width)) if filled == filled else 0
+        return self._cached_row(
+            param_index,
+            param_name,
+            normalized_value,
+            raw_value,
+            unit,
+            band,
+            filled,
+            self.config.show_raw_values,
         )
 
-        # Build row
-        row = f"  [{param_index:2d}] {param_name:20s}: "
-        row += value_color + f"{normalized_value:6.3f}" + MonitorColors.RESET
+    def _cached_row(
+        self,
+        param_index: int,
+        param_name: str,
+        normalized_value: float,
+        raw_value: Optional[float],
+        unit: Optional[str],
+        band: int,
+        filled: int,
+        show_raw_values: bool,
+    ) -> str:
+        """Format a row through the cache, keyed on the displayed digits."""
+        # Rounding to the printed precision leaves the text unchanged but
+        # makes values that only differ in hidden digits share an entry
+        if raw_value is not None:
+            raw_value = round(raw_value, 2) if show_raw_values else None
+        if self._row_width != self.config.progress_bar_width:
+            self._build_row_formatter()
+        return self._row_cache(
+            param_index,
+            param_name,
+            round(normalized_value, 3),
+            raw_value,
+            unit,
+            band,
+            filled,
+            show_raw_values,
+        )
 
-        if self.config.show_raw_values and raw_value is not None:
-            raw_str = f"{raw_value:8.2f}"
-            if unit:
-                raw_str += f" {unit}"
-            row += f" (raw: {raw_str})"
+    def _build_row_formatter(self) -> None:
+        """(Re)build the cached row formatter for the current bar width.
 
-        row += f" [{progress_bar}]"
+        The formatter closes over the progress bars of this width and the
+        band colors, so a row is one table lookup per part plus the f-string.
+        Terminal width is applied when frames are written (update_display),
+        since the real terminal can be narrower than the config says.
+        """
+        width = self.config.progress_bar_width
+        if width == self._row_width:
+            return
+        bars = tuple(self._progress_bars())
+        colors = _BAND_COLORS
+        reset = MonitorColors.RESET
+
+        def format_row(
+            param_index, param_name, normalized_value, raw_value, unit, band,
+            filled, show_raw_values,
+        ):
+            head = (
+                f"  [{param_index:2d}] {param_name:20s}: {colors[band]}"
+                f"{normalized_value:6.3f}{reset}"
+            )
+            bar = bars[filled]
+            if show_raw_values and raw_value is not None:
+                if unit:
+                    return f"{head} (raw: {raw_value:8.2f} {unit}) [{bar}]"
+                return f"{head} (raw: {raw_value:8.2f}) [{bar}]"
+            return f"{head} [{bar}]"
 
-        return row
+        self._row_cache = functools.lru_cache(maxsize=256)(format_row)
+        self._row_width = width
 
     def render_polling_status(
         self,
@@ -259,10 +447,11 @@ class MonitorDisplay:
         self,
         poller_status: Dict,
         parameter_configs: List[Dict],
-        current_values: Dict[int, float],
+        current_values: Mapping[int, float],
         rule_stats: Dict,
         active_rules: List[Dict],
         debug_info: Optional[Dict] = None,
+        raw_values: Optional[Mapping[int, float]] = None,
     ) -> str:
         """
         Render complete monitoring display.
@@ -270,10 +459,13 @@ class MonitorDisplay:
         Args:
             poller_status: Poller status dict from AudioAnalysisController
             parameter_configs: List of parameter configuration dicts
-            current_values: Dict of parameter_index -> normalized_value
+            current_values: Parameter_index -> normalized_value (a snapshot's
+                ParameterValues are read as arrays directly)
             rule_stats: Rule engine statistics dict
             active_rules: List of recent rule triggers
             debug_info: Optional debug information dict
+            raw_values: Parameter_index -> raw_value (default: "raw_<index>"
+                entries of current_values)
 
         Returns:
             Complete formatted display string
@@ -298,22 +490,29 @@ class MonitorDisplay:
             )
         )
 
-        # Parameter values
+        # Parameter values: color bands and bar lengths for all rows at once
         sections.append(self.render_header("PARAMETER VALUES"))
-        for config in parameter_configs:
-            param_idx = config["index"]
-            if param_idx in current_values:
-                sections.append(
-                    self.render_parameter_row(
-                        param_index=param_idx,
-                        param_name=config["name"],
-                        normalized_value=current_values[param_idx],
-                        raw_value=current_values.get(f"raw_{param_idx}"),
-                        min_value=config.get("min_value"),
-                        max_value=config.get("max_value"),
-                        unit=config.get("unit"),
-                    )
+        shown, array, raws = self._gather_values(
+            parameter_configs, current_values, raw_values
+        )
+        bands = classify_bands(array).tolist()
+        width = self.config.progress_bar_width
+        fills = np.clip(np.nan_to_num(array * width), 0, width).astype(np.intp)
+        show_raw_values = self.config.show_raw_values
+        rows = zip(shown, array.tolist(), raws, bands, fills.tolist())
+        for config, value, raw, band, filled in rows:
+            sections.append(
+                self._cached_row(
+                    config["index"],
+                    config["name"],
+                    value,
+                    raw,
+                    config.get("unit"),
+                    band,
+                    filled,
+                    show_raw_values,
                 )
+            )
 
         # Rule statistics
         sections.append(
@@ -339,6 +538,36 @@ class MonitorDisplay:
         # Join sections with empty lines
         return "\n\n".join(sections)
 
+    @staticmethod
+    def _gather_values(
+        parameter_configs: List[Dict],
+        current_values: Mapping[int, float],
+        raw_values: Optional[Mapping[int, float]],
+    ) -> tuple:
+        """Configs with a value, their values as an array, and raw values."""
+        if isinstance(current_values, ParameterValues):
+            # Snapshot values: one fancy index instead of a lookup per row
+            index_map = current_values.index_map
+            shown = [c for c in parameter_configs if c["index"] in index_map]
+            positions = [index_map[c["index"]] for c in shown]
+            array = current_values.array[positions]
+            if (
+                isinstance(raw_values, ParameterValues)
+                and raw_values.index_map is index_map
+            ):
+                return shown, array, raw_values.array[positions].tolist()
+        else:
+            shown = [c for c in parameter_configs if c["index"] in current_values]
+            array = np.array(
+                [current_values[c["index"]] for c in shown], dtype=np.float64
+            )
+
+        if raw_values is None:
+            raws = [current_values.get(f"raw_{c['index']}") for c in shown]
+        else:
+            raws = [raw_values.get(c["index"]) for c in shown]
+        return shown, array, raws
+
     def update_display(self, display_text: str) -> None:
         """
         Update terminal display with new content.
@@ -346,12 +575,44 @@ class MonitorDisplay:
         Args:
             display_text: Complete formatted display string
         """
-        # Clear screen and render
-        self.clear_screen()
-        print(display_text, flush=True)
+        terminal_size = shutil.get_terminal_size()
+        # Wrapped rows would shift every row below them, breaking the diff
+        columns = terminal_size.columns
+        lines = [truncate_visible(line, columns) for line in display_text.split("\n")]
+        prev_lines = self._prev_lines
+
+        if not prev_lines or terminal_size != self._terminal_size:
+            # First frame or resized terminal: clear and repaint everything
+            payload = "\033[2J\033[H" + "\n".join(lines) + "\n"
+        else:
+            # Rewrite only the rows that changed since the previous frame
+            parts = [
+                f"\033[{row};1H{line}\033[K"
+                for row, line in enumerate(lines, start=1)
+                if row > len(prev_lines) or prev_lines[row - 1] != line
+            ]
+            if len(lines) < len(prev_lines):
+                parts.append(f"\033[{len(lines) + 1};1H\033[J")  # Drop old tail
+            if parts:
+                parts.append(f"\033[{len(lines) + 1};1H")  # Park below frame
+            payload = "".join(parts)
+
+        self._prev_lines = lines
+        self._terminal_size = terminal_size
+
+        # One write (one syscall) per frame, and none if nothing changed
+        if payload:
+            fd = self._stdout_fd
+            if fd is None:
+                sys.stdout.write(payload)
+                sys.stdout.flush()
+            else:
+                data = memoryview(payload.encode())
+                while data:  # Terminals may accept a large frame in parts
+                    data = data[os.write(fd, data) :]
 
         # Update refresh time
-        self._last_reresh_time = time.time()
+        self._last_refresh_time = time.time()
 
 
 class AudioAnalysisMonitor:
@@ -380,15 +641,37 @@ class AudioAnalysisMonitor:
         self.display = display or MonitorDisplay(config or MonitorConfig())
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
 
-        # Track recent rule triggers for display
-        self._recent_triggers: List[Dict] = []
+        # Set by event callbacks; the render thread sleeps on it and redraws
+        # at most refresh_rate_hz times a second, so bursts of events
+        # coalesce into one frame (and idle frames still tick once a second)
+        self._dirty = threading.Event()
+        self._dirty.set()
+        # True while the poller reports snapshots through on_snapshot;
+        # otherwise the render thread refreshes at refresh_rate_hz
+        self._snapshot_events = False
+
+        # Track recent rule triggers for display (newest first, bounded)
         self._max_triggers = 10
+        self._recent_triggers: deque = deque(maxlen=self._max_triggers)
 
         # Store parameter configs for display
         self._parameter_configs: List[Dict] = []
 
+    def _get_poller(self):
+        """The controller's poller (``poller``, or ``_poller`` on stubs)."""
+        poller = getattr(self.controller, "poller", None)
+        if poller is None:
+            poller = getattr(self.controller, "_poller", None)
+        return poller
+
+    def _get_rule_engine(self):
+        """The controller's rule engine (``engine``, or ``_rule_engine``)."""
+        engine = getattr(self.controller, "engine", None)
+        if engine is None:
+            engine = getattr(self.controller, "_rule_engine", None)
+        return engine
+
     def _update_trigger_list(self, actions_result: List[Dict]) -> None:
         """
         Update recent trigger list with new actions.
@@ -396,20 +679,19 @@ class AudioAnalysisMonitor:
         Args:
             actions_result: List of action result dicts from rule evaluation
         """
-        with self._lock:
-            for action_result in actions_result:
-                # Extract rule info from action result
-                rule_info = {
-                    "rule_id": action_result.get("rule_id", "unknown"),
-                    "rule_name": action_result.get("rule_name", "Unknown Rule"),
-                    "triggered_at": time.time(),
-                    "actions": action_result.get("actions", []),
-                }
+        triggered_at = time.time()
+        for action_result in actions_result:
+            # Extract rule info from action result
+            rule_info = {
+                "rule_id": action_result.get("rule_id", "unknown"),
+                "rule_name": action_result.get("rule_name", "Unknown Rule"),
+                "triggered_at": triggered_at,
+                "actions": action_result.get("actions", []),
+            }
 
-                # Add to front of list and keep max size
-                self._recent_triggers.insert(0, rule_info)
-                if len(self._recent_triggers) > self._max_triggers:
-                    self._recent_triggers.pop()
+            # Add to front; the deque drops the oldest entry when full. A
+            # single deque append is atomic, so callers need no lock
+            self._recent_triggers.appendleft(rule_info)
 
     def _get_display_data(self) -> Dict:
         """
@@ -421,47 +703,40 @@ class AudioAnalysisMonitor:
         # Get controller status
         poller_status = self.controller.get_status()
 
-        # Get current parameter values
-        current_values = {}
-        raw_values = {}
-        if hasattr(self.controller, "_poller"):
-            snapshot = self.controller._poller.get_latest_snapshot()
+        # Current parameter values, passed on as the snapshot's arrays
+        current_values: Mapping[int, float] = {}
+        raw_values: Mapping[int, float] = {}
+        poller = self._get_poller()
+        if poller is not None:
+            snapshot = poller.get_latest_snapshot()
             if snapshot:
-                for param_idx, norm_val in snapshot.values.items():
-                    current_values[param_idx] = norm_val
-                for param_idx, raw_val in snapshot.raw_values.items():
-                    raw_values[f"raw_{param_idx}"] = raw_val
-
-                # Combine
-                current_values.update(raw_values)
+                current_values = snapshot.values
+                raw_values = snapshot.raw_values
 
         # Get rule engine statistics
         rule_stats = {}
-        if hasattr(self.controller, "_rule_engine"):
-            stats = self.controller._rule_engine.get_stats()
+        engine = self._get_rule_engine()
+        if engine is not None:
+            stats = engine.get_stats()
             rule_stats = {
                 "evaluations": stats.get("evaluations", 0),
                 "triggers": stats.get("triggers", 0),
                 "actions": stats.get("actions", 0),
                 "errors": stats.get("errors", 0),
-                "enabled_rules": len(
-                    [r for r in self.controller._rule_engine._rules if r.enabled]
-                )
-                if hasattr(self.controller._rule_engine, "_rules")
-                else 0,
-                "total_rules": len(self.controller._rule_engine._rules)
-                if hasattr(self.controller._rule_engine, "_rules")
+                "enabled_rules": len([r for r in engine._rules if r.enabled])
+                if hasattr(engine, "_rules")
                 else 0,
+                "total_rules": len(engine._rules) if hasattr(engine, "_rules") else 0,
             }
 
-        # Get recent triggers with lock
-        with self._lock:
-            recent_triggers = self._recent_triggers.copy()
+        # Copy recent triggers (one C-level pass, atomic like the appends)
+        recent_triggers = list(self._recent_triggers)
 
         return {
             "poller_status": poller_status,
             "parameter_configs": self._parameter_configs,
             "current_values": current_values,
+            "raw_values": raw_values,
             "rule_stats": rule_stats,
             "active_rules": recent_triggers,
         }
@@ -470,10 +745,18 @@ class AudioAnalysisMonitor:
         """
         Main rendering loop running in separate thread.
         """
-        interval = 1.0 / self.display.config.refresh_rate_hz
-
         while self._running:
+            if self._snapshot_events:
+                # Wait for new data; without any, redraw once a second for
+                # the clock. Without snapshot events, the sleep below paces
+                # a timed refresh instead.
+                self._dirty.wait(timeout=1.0)
+                if not self._running:
+                    break
+
             start_time = time.time()
+            interval = 1.0 / self.display.config.refresh_rate_hz
+            self._dirty.clear()  # Events during this frame mark the next one
 
             try:
                 # Collect display data
@@ -502,6 +785,16 @@ class AudioAnalysisMonitor:
             actions_result: List of action result dicts
         """
         self._update_trigger_list(actions_result)
+        self._dirty.set()
+
+    def on_snapshot(self, snapshot) -> None:
+        """
+        Callback for the poller: new parameter values need a redraw.
+
+        Args:
+            snapshot: Latest ParameterSnapshot (read later by the render thread)
+        """
+        self._dirty.set()
 
     def start(self) -> None:
         """
@@ -513,11 +806,16 @@ class AudioAnalysisMonitor:
             return
 
         # Register callback for rule actions
-        if hasattr(self.controller, "_rule_engine"):
-            self.controller._rule_engine.add_callback(self.on_rule_actions)
-
-        # Store parameter configs
-        if hasattr(self.controller, "_poller"):
+        engine_add_callback = getattr(self._get_rule_engine(), "add_callback", None)
+        if engine_add_callback is not None:
+            engine_add_callback(self.on_rule_actions)
+
+        # Store parameter configs and redraw on new snapshots
+        poller = self._get_poller()
+        if poller is not None:
+            configs = getattr(poller, "_params_to_poll", None)
+            if configs is None:  # AudioAnalysisPoller: index -> config
+                configs = list(getattr(poller, "params_to_poll", {}).values())
             self._parameter_configs = [
                 {
                     "index": cfg.index,
@@ -526,10 +824,15 @@ class AudioAnalysisMonitor:
                     "max_value": cfg.max_value,
                     "unit": cfg.unit,
                 }
-                for cfg in self.controller._poller._params_to_poll
+                for cfg in configs
             ]
+        add_callback = getattr(poller, "add_callback", None)
+        self._snapshot_events = add_callback is not None
+        if add_callback is not None:
+            add_callback(self.on_snapshot)
 
         # Start rendering thread
+        self.display.attach_terminal()
         self._running = True
         self._thread = threading.Thread(target=self._render_loop, daemon=True)
         self._thread.start()
@@ -544,17 +847,26 @@ class AudioAnalysisMonitor:
             return
 
         self._running = False
+        self._dirty.set()  # Wake the render thread so it can exit
+
+        remove_callback = getattr(self._get_poller(), "remove_callback", None)
+        if self._snapshot_events and remove_callback is not None:
+            remove_callback(self.on_snapshot)
+        self._snapshot_events = False
 
         # Wait for thread to finish
         if self._thread:
             self._thread.join(timeout=1.0)
 
-        # Clear screen on exit
-        print("\033[2J\033[H", end="", flush=True)
+        # Clear screen on exit (the next frame is repainted in full)
+        self.display.detach_terminal()
+        self.display.clear_screen()
+        sys.stdout.flush()
 
     def toggle_debug(self) -> None:
         """Toggle debug display mode."""
         self.display.config.show_debug = not self.display.config.show_debug
+        self._dirty.set()
 
     def set_refresh_rate(self, rate_hz: int) -> None:
         """
@@ -0,0 +1,11 @@
+"""
+Shared fixtures for the audio analysis tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(tmp_path_factory, monkeypatch):
+    """Keep caches written by the code under test out of the real home dir."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
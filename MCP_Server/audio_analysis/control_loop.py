@@ -186,6 +186,9 @@ class AudioAnalysisController:
         # Stop poller (waits for thread to finish)
         self.poller.stop()
 
+        # No more snapshots arrive, so release the engine's action workers
+        self.engine.close()
+
         self.stop_time = time.time()
         duration = self.stop_time - self.start_time if self.start_time else 0
 
@@ -199,7 +202,8 @@ class AudioAnalysisController:
         Get comprehensive status of controller and components.
 
         Returns:
-            Dictionary with poller status, engine stats, and controller state
+            New dictionary with poller status, engine stats, and controller
+            state; callers may keep or modify it freely
         """
         poller_status = self.poller.get_status()
         engine_stats = self.engine.get_stats()
@@ -231,8 +235,8 @@ class AudioAnalysisController:
         if latest_snapshot:
             status["latest_values"] = {
                 "timestamp": latest_snapshot.timestamp,
-                "normalized": latest_snapshot.values,
-                "raw": latest_snapshot.raw_values,
+                "normalized": dict(latest_snapshot.values),
+                "raw": dict(latest_snapshot.raw_values),
             }
 
         return status
@@ -245,7 +249,7 @@ class AudioAnalysisController:
             Dict mapping parameter_index -> normalized_value (0.0-1.0), or None
         """
         snapshot = self.poller.get_latest_snapshot()
-        return snapshot.values if snapshot else None
+        return dict(snapshot.values) if snapshot else None
 
     def get_raw_parameter_values(self) -> Optional[Dict[int, float]]:
         """
@@ -255,7 +259,7 @@ class AudioAnalysisController:
             Dict mapping parameter_index -> raw_value, or None
         """
         snapshot = self.poller.get_latest_snapshot()
-        return snapshot.raw_values if snapshot else None
+        return dict(snapshot.raw_values) if snapshot else None
 
     def get_parameter_value(self, parameter_index: int) -> Optional[float]:
         """
@@ -333,18 +337,24 @@ class AudioAnalysisController:
         # Latest values
         if "latest_values" in status:
             latest = status["latest_values"]
+
+            # Resolve name/unit once per parameter; both sections share them
+            labels = {}
+            for idx in (*latest["normalized"], *latest["raw"]):
+                if idx not in labels:
+                    config = self.get_parameter_config(idx)
+                    labels[idx] = (
+                        (config.name, config.unit) if config else (f"Param {idx}", "")
+                    )
+
             print(f"\nLATEST VALUES ({time.ctime(latest['timestamp'])}):")
             print("  Normalized:")
             for idx, val in latest["normalized"].items():
-                config = self.get_parameter_config(idx)
-                param_name = config.name if config else f"Param {idx}"
-                print(f"    {param_name} (idx {idx}): {val:.4f}")
+                print(f"    {labels[idx][0]} (idx {idx}): {val:.4f}")
 
             print("  Raw:")
             for idx, val in latest["raw"].items():
-                config = self.get_parameter_config(idx)
-                param_name = config.name if config else f"Param {idx}"
-                unit = config.unit if config else ""
+                param_name, unit = labels[idx]
                 print(f"    {param_name} (idx {idx}): {val:.2f} {unit}")
 
         print("=" * 70 + "\n")
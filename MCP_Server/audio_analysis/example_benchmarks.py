@@ -9,9 +9,25 @@ import time
 import gc
 from typing import Dict
 
+import numpy as np
+
 from .benchmarks import BenchmarkSuite, DataCollector, CPUMonitor, LatencyTimer
 from .benchmark_report import generate_report
 
+# Optional JIT compiler for the compute-kernel example
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 # ============================================================================
 # Example 1: Simple Data Collection
@@ -35,16 +51,16 @@ def example_1_simple_data_collection():
         value = 0.5 + 0.1 * (i % 10 - 5)  # Simulated parameter value
         collector.add_sample(value)
 
+    values = collector.get_all_values()
     print(f"Collected {collector.size()} samples")
-    print(f"First 5: {collector.get_all_values()[:5]}")
-    print(f"Last 5:  {collector.get_all_values()[-5:]}")
+    print(f"First 5: {values[:5]}")
+    print(f"Last 5:  {values[-5:]}")
     print()
 
     # Statistics
-    values = collector.get_all_values()
-    print(f"Min:  {min(values):.4f}")
-    print(f"Max:  {max(values):.4f}")
-    print(f"Mean: {sum(values) / len(values):.4f}")
+    print(f"Min:  {values.min():.4f}")
+    print(f"Max:  {values.max():.4f}")
+    print(f"Mean: {values.mean():.4f}")
     print()
 
 
@@ -75,11 +91,12 @@ def example_2_cpu_monitoring():
     print("CPU monitoring complete.")
 
     cpu_values = monitor.get_cpu_values()
-    if cpu_values:
+    if len(cpu_values):
         print(f"Collected {len(cpu_values)} CPU samples")
-        print(f"Min:  {min(cpu_values):.2f}%")
-        print(f"Max:  {max(cpu_values):.2f}%")
-        print(f"Mean: {sum(cpu_values) / len(cpu_values):.2f}%")
+        print(f"Min:  {cpu_values.min():.2f}%")
+        print(f"Max:  {cpu_values.max():.2f}%")
+        print(f"Mean: {cpu_values.mean():.2f}%")
+        print(f"P95:  {np.percentile(cpu_values, 95):.2f}%")
     else:
         print("No CPU samples collected (psutil may not be available)")
     print()
@@ -100,9 +117,10 @@ def example_3_latency_timing():
     print()
 
     latencies = []
+    timer = LatencyTimer()
 
     for i in range(100):
-        timer = LatencyTimer()
+        timer.reset()
         timer.start()
 
         # Simulate polling
@@ -134,6 +152,15 @@ def example_3_latency_timing():
 # ============================================================================
 
 
+@njit(cache=True)
+def _jit_sum(n):
+    """Tight, deterministic compute kernel used as a benchmark workload."""
+    total = 0.0
+    for i in range(n):
+        total += i * 1.0001
+    return total
+
+
 def example_4_custom_benchmark():
     """
     Demonstrates running a custom benchmark function.
@@ -145,13 +172,19 @@ def example_4_custom_benchmark():
 
     suite = BenchmarkSuite()
 
-    def mock_operation():
-        """Simulate an operation to benchmark."""
-        time.sleep(0.001)
-        return time.perf_counter()
+    def jit_sum_operation():
+        """Time one call of the compiled compute kernel."""
+        start = time.perf_counter()
+        _jit_sum(10_000)
+        return time.perf_counter() - start
+
+    # Warm up once so JIT compilation is not part of the measurement
+    _jit_sum(10_000)
 
     result = suite.run_benchmark(
-        name="Mock Operation Time", func=mock_operation, target_samples=100
+        name="JIT Sum" if HAS_NUMBA else "Python Sum",
+        func=jit_sum_operation,
+        target_samples=100,
     )
 
     print(f"Benchmark: {result.name}")
@@ -278,6 +311,9 @@ def example_7_complete_benchmark_suite():
 
     suite = BenchmarkSuite()
 
+    # Run the benchmarks one after another: sharing the interpreter (and
+    # the GIL) with each other would skew the timings being measured.
+
     # Benchmark 1: Mock polling rate
     class MockPoller:
         def poll_parameters(self):
@@ -346,9 +382,10 @@ def example_8_latency_context_manager():
     print()
 
     timings = []
+    timer = LatencyTimer()
 
     for i in range(10):
-        timer = LatencyTimer()
+        timer.reset()
 
         # Use context manager pattern (if available)
         # For now, use start/stop
@@ -423,9 +460,10 @@ def example_10_stage_timing():
     print()
 
     measurements = {"poll": [], "evaluate": [], "act": [], "total": []}
+    timer = LatencyTimer()
 
     for i in range(20):
-        timer = LatencyTimer()
+        timer.reset()
         timer.start()
 
         # Poll stage
@@ -6,14 +6,28 @@ with the AudioAnalysisController to display real-time monitoring
 of audio analysis parameters and rule execution.
 """
 
+import argparse
 import sys
 import os
+import selectors
+import threading
+import time
+import traceback
+from typing import Optional
+
+if sys.platform == "win32":
+    import ctypes
+    import msvcrt
+else:
+    import termios
+    import tty
 
 # Add MCP_Server to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 from MCP_Server.audio_analysis.cli_monitor import AudioAnalysisMonitor, MonitorConfig
-from MCP_Server.audio_analysis.control_loop import AudioAnalysisController
+from MCP_Server.audio_analysis.polling import ParameterConfig
+from MCP_Server.audio_analysis.rules import Condition, Rule, RuleEngine, RuleSet
 
 
 class MockMCPClient:
@@ -34,6 +48,18 @@ class MockMCPClient:
         return {"success": True, "result": "mock_result"}
 
 
+class _StubPoller:
+    """Lightweight stand-in for AudioAnalysisPoller."""
+
+    __slots__ = ("_params_to_poll", "get_latest_snapshot", "get_status")
+
+
+class _StubController:
+    """Lightweight stand-in for AudioAnalysisController."""
+
+    __slots__ = ("_poller", "_rule_engine", "get_status")
+
+
 def example_1_basic_monitor():
     """
     Example 1: Basic monitor with mock values.
@@ -45,21 +71,23 @@ def example_1_basic_monitor():
     print("EXAMPLE 1: Basic Monitor with Mock Values")
     print("=" * 60)
 
-    # Create mock controller
-    mock_controller = create_mock_controller()
-
     # Create monitor with default config
-    monitor = AudioAnalysisMonitor(mock_controller)
+    config = MonitorConfig()
+
+    # Create mock controller that signals after 5 seconds worth of frames
+    done = threading.Event()
+    mock_controller = create_mock_controller(
+        frames_done=done, target_frames=config.refresh_rate_hz * 5
+    )
+    monitor = AudioAnalysisMonitor(mock_controller, config=config)
 
     # Start monitor
     print("\nStarting monitor for 5 seconds...")
     monitor.start()
 
     try:
-        # Run for 5 seconds
-        import time
-
-        time.sleep(5)
+        # Run until the frames are rendered (5 seconds max)
+        done.wait(timeout=5.0)
     finally:
         monitor.stop()
         print("Monitor stopped.")
@@ -76,11 +104,14 @@ def example_2_custom_refresh_rate():
     print("EXAMPLE 2: Monitor with 20 Hz Refresh Rate")
     print("=" * 60)
 
-    # Create mock controller
-    mock_controller = create_mock_controller()
-
     # Create monitor with custom config
     config = MonitorConfig(refresh_rate_hz=20, show_raw_values=True)
+
+    # Create mock controller that signals after 5 seconds worth of frames
+    done = threading.Event()
+    mock_controller = create_mock_controller(
+        frames_done=done, target_frames=config.refresh_rate_hz * 5
+    )
     monitor = AudioAnalysisMonitor(mock_controller, config=config)
 
     # Start monitor
@@ -88,9 +119,7 @@ def example_2_custom_refresh_rate():
     monitor.start()
 
     try:
-        import time
-
-        time.sleep(5)
+        done.wait(timeout=5.0)
     finally:
         monitor.stop()
         print("Monitor stopped.")
@@ -107,10 +136,12 @@ def example_3_with_rules():
     print("EXAMPLE 3: Monitor with Rule Engine")
     print("=" * 60)
 
-    from MCP_Server.audio_analysis.rules import Condition, Rule, RuleSet
-
-    # Create mock controller
-    mock_controller = create_mock_controller()
+    # Create mock controller that signals after 5 seconds worth of frames
+    config = MonitorConfig()
+    done = threading.Event()
+    mock_controller = create_mock_controller(
+        frames_done=done, target_frames=config.refresh_rate_hz * 5
+    )
 
     # Create a sample rule
     rule = Rule(
@@ -130,16 +161,14 @@ def example_3_with_rules():
     mock_controller._rule_engine.load_ruleset(ruleset)
 
     # Create monitor
-    monitor = AudioAnalysisMonitor(mock_controller)
+    monitor = AudioAnalysisMonitor(mock_controller, config=config)
 
     # Start monitor
     print("\nStarting monitor with rules for 5 seconds...")
     monitor.start()
 
     try:
-        import time
-
-        time.sleep(5)
+        done.wait(timeout=5.0)
     finally:
         monitor.stop()
         print("Monitor stopped.")
@@ -167,38 +196,63 @@ def example_4_interactive_mode():
     monitor.start()
 
     try:
-        import time
-        import select
-        import sys
-
         print("Interactive mode started. Press 'd' to toggle debug, 'q' to quit...")
 
-        # Interactive loop (non-blocking input check)
-        start_time = time.time()
-        while time.time() - start_time < 15:  # Run for 15 seconds max
-            # Check for input (Unix-like systems only)
-            # On Windows, use msvcrt module
-            if sys.platform == "win32":
-                import msvcrt
-
-                if msvcrt.kbhit():
-                    char = msvcrt.getch().decode("utf-8")
-                    if char.lower() == "d":
-                        monitor.toggle_debug()
-                        print("Debug mode toggled")
-                    elif char.lower() == "q":
-                        break
-            else:
-                # Unix-like select for non-blocking input
-                if select.select([sys.stdin], [], [], 0.1)[0]:
-                    char = sys.stdin.read(1)
-                    if char.lower() == "d":
-                        monitor.toggle_debug()
-                        print("Debug mode toggled")
-                    elif char.lower() == "q":
-                        break
-
-            time.sleep(0.1)
+        # Interactive loop: block until a key arrives or the deadline passes
+        deadline_ns = time.monotonic_ns() + 15 * 10**9  # Run for 15 seconds max
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            stdin_handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+
+            while True:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                kernel32.WaitForSingleObject(stdin_handle, remaining_ns // 10**6)
+                if not msvcrt.kbhit():
+                    # Non-key console events (mouse, focus) also signal the handle
+                    kernel32.FlushConsoleInputBuffer(stdin_handle)
+                    continue
+                char = msvcrt.getch().decode("utf-8", errors="ignore")
+                if char.lower() == "d":
+                    monitor.toggle_debug()
+                    print("Debug mode toggled")
+                elif char.lower() == "q":
+                    break
+        else:
+            stdin_fd = sys.stdin.fileno()
+
+            # Deliver keystrokes immediately instead of after Enter
+            saved_tty = None
+            if os.isatty(stdin_fd):
+                saved_tty = termios.tcgetattr(stdin_fd)
+                tty.setcbreak(stdin_fd)
+
+            try:
+                # Register stdin once; DefaultSelector uses epoll on Linux
+                with selectors.DefaultSelector() as sel:
+                    sel.register(sys.stdin, selectors.EVENT_READ)
+
+                    while True:
+                        remaining_ns = deadline_ns - time.monotonic_ns()
+                        if remaining_ns <= 0:
+                            break
+                        if not sel.select(timeout=remaining_ns / 1e9):
+                            break  # Deadline reached
+                        data = os.read(stdin_fd, 1)
+                        if not data:
+                            # EOF on stdin: keep monitoring until the deadline
+                            sel.unregister(sys.stdin)
+                            continue
+                        char = data.decode("utf-8", errors="ignore")
+                        if char.lower() == "d":
+                            monitor.toggle_debug()
+                            print("Debug mode toggled")
+                        elif char.lower() == "q":
+                            break
+            finally:
+                if saved_tty is not None:
+                    termios.tcsetattr(stdin_fd, termios.TCSADRAIN, saved_tty)
 
     except KeyboardInterrupt:
         pass
@@ -207,58 +261,67 @@ def example_4_interactive_mode():
         print("Monitor stopped.")
 
 
-def create_mock_controller():
+def create_mock_controller(
+    frames_done: Optional[threading.Event] = None, target_frames: int = 0
+):
     """
     Create a mock AudioAnalysisController for testing.
 
+    Args:
+        frames_done: Event set once target_frames snapshots have been read
+        target_frames: Number of snapshots to serve before signalling
+
     Returns:
         Mock controller with realistic behavior
     """
-    import time
-    from unittest.mock import Mock
-
-    controller = Mock(spec=AudioAnalysisController)
+    controller = _StubController()
 
     # Create mock poller
-    mock_poller = Mock()
+    mock_poller = _StubPoller()
     mock_poller._params_to_poll = []
-    mock_poller.get_status.return_value = {
-        "actual_rate_hz": 10.0,
-        "target_rate_hz": 10.0,
-        "uptime_seconds": 0.0,
-        "total_snapshots": 0,
-    }
 
     # Mock snapshot with changing values
     class MockSnapshot:
+        # Plain dicts work too: the monitor reads them as mappings
+        __slots__ = ("timestamp", "monotonic_ns", "values", "raw_values")
+
         def __init__(self):
             self.timestamp = time.time()
+            self.monotonic_ns = time.monotonic_ns()
             self.values = {0: 0.5, 1: 0.3, 2: 0.7}
-            self.raw_values = {"raw_0": -10.0, "raw_1": -20.0, "raw_2": -5.0}
-
-    # Return new snapshot with slight variations
+            self.raw_values = {0: -10.0, 1: -20.0, 2: -5.0}
+
+    # Reuse one snapshot and vary its values slightly. The variations are
+    # periodic over 1000 reads, so precompute one row of values per read.
+    snapshot = MockSnapshot()
+    rows = tuple(
+        (
+            0.5 + 0.1 * (i % 10) / 10.0,
+            0.3 + 0.1 * ((i // 10) % 10) / 10.0,
+            0.7 + 0.1 * ((i // 100) % 10) / 10.0,
+        )
+        for i in range(1000)
+    )
     var_counter = [0]
 
     def get_latest_snapshot():
-        var_counter[0] += 1
-        snapshot = MockSnapshot()
-        # Vary values slightly
-        snapshot.values[0] = 0.5 + 0.1 * (var_counter[0] % 10) / 10.0
-        snapshot.values[1] = 0.3 + 0.1 * ((var_counter[0] // 10) % 10) / 10.0
-        snapshot.values[2] = 0.7 + 0.1 * ((var_counter[0] // 100) % 10) / 10.0
+        c = var_counter[0] + 1
+        var_counter[0] = c
+        values = snapshot.values
+        values[0], values[1], values[2] = rows[c % 1000]
+        snapshot.timestamp = time.time()
+        snapshot.monotonic_ns = time.monotonic_ns()
+        if frames_done is not None and c >= target_frames:
+            frames_done.set()
         return snapshot
 
     mock_poller.get_latest_snapshot = get_latest_snapshot
 
     # Create rule engine mock
-    from MCP_Server.audio_analysis.rules import RuleEngine
-
     mock_rule_engine = RuleEngine(MockMCPClient())
-    mock_rule_engine.add_callback = Mock()
+    mock_rule_engine.add_callback = lambda *args, **kwargs: None
 
     # Set up parameter configs
-    from MCP_Server.audio_analysis.polling import ParameterConfig
-
     mock_poller._params_to_poll = [
         ParameterConfig(
             index=0, name="Loudness (LUFS)", min_value=-70.0, max_value=-5.0, unit="dB"
@@ -275,52 +338,73 @@ def create_mock_controller():
     controller._poller = mock_poller
     controller._rule_engine = mock_rule_engine
 
-    # Mock get_status
+    # Mock get_status: build the dict once and refresh only the live fields
+    start_time = time.monotonic()
+    status = {
+        "actual_rate_hz": 10.0,
+        "target_rate_hz": 10.0,
+        "uptime_seconds": 0.0,
+        "total_snapshots": 0,
+    }
+
     def get_status():
-        mock_poller.get_status.return_value = {
-            "actual_rate_hz": 10.0,
-            "target_rate_hz": 10.0,
-            "uptime_seconds": time.time(),
-            "total_snapshots": var_counter[0],
-        }
-        return mock_poller.get_status()
+        status["uptime_seconds"] = time.monotonic() - start_time
+        status["total_snapshots"] = var_counter[0]
+        return status
 
+    mock_poller.get_status = get_status
     controller.get_status = get_status
 
     return controller
 
 
-def main():
-    """Run all examples."""
-    examples = [
-        example_1_basic_monitor,
-        example_2_custom_refresh_rate,
-        example_3_with_rules,
-        example_4_interactive_mode,
-    ]
+EXAMPLES = (
+    ("1", "Basic Monitor", example_1_basic_monitor),
+    ("2", "Custom Refresh Rate", example_2_custom_refresh_rate),
+    ("3", "With Rules", example_3_with_rules),
+    ("4", "Interactive Mode", example_4_interactive_mode),
+)
+
+
+def main(argv=None):
+    """Run the selected example (or all of them)."""
+    parser = argparse.ArgumentParser(description="CLI Monitor Examples")
+    parser.add_argument(
+        "example",
+        nargs="?",
+        choices=[key for key, _, _ in EXAMPLES] + ["all"],
+        help="Which example to run (prompted for on a TTY if omitted)",
+    )
+    args = parser.parse_args(argv)
 
     print("\n" + "=" * 60)
     print("CLI MONITOR EXAMPLES")
     print("=" * 60)
     print("\nAvailable examples:")
-    for i, example in enumerate(examples, 1):
-        print(
-            f"  {i}. {example.__name__.replace('example_', '').replace('_', ' ').title()}"
-        )
+    for key, title, _ in EXAMPLES:
+        print(f"  {key}. {title}")
     print("  all. Run all examples")
 
-    choice = input("\nSelect example (1-4, all): ").strip().lower()
+    choice = args.example
+    if choice is None:
+        # Only prompt when someone is there to answer
+        if sys.stdin.isatty():
+            choice = input("\nSelect example (1-4, all): ").strip().lower()
+        else:
+            choice = "all"
 
     if choice == "all":
-        for example in examples:
+        for _, _, example in EXAMPLES:
             try:
                 example()
             except KeyboardInterrupt:
                 print("\nExample interrupted.")
-    elif choice in ("1", "2", "3", "4"):
-        examples[int(choice) - 1]()
     else:
-        print("Invalid choice.")
+        example = {key: fn for key, _, fn in EXAMPLES}.get(choice)
+        if example is None:
+            print("Invalid choice.")
+        else:
+            example()
 
 
 if __name__ == "__main__":
@@ -330,6 +414,4 @@ if __name__ == "__main__":
         print("\n\nInterrupted by user.")
     except Exception as e:
         print(f"\nError: {e}")
-        import traceback
-
         traceback.print_exc()
@@ -11,7 +11,9 @@ Setup:
 4. Run: python MCP_Server/audio_analysis/example_control_loop.py
 """
 
+import argparse
 import sys
+import traceback
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -212,16 +214,25 @@ def example_custom_callback():
         update_rate_hz=10.0,
     )
 
+    # Parameter configs are static, so index them once for the callback
+    config_by_index = {p.index: p for p in params_to_poll}
+
     # Add custom callback to monitor parameter values
     def monitor_callback(snapshot: ParameterSnapshot):
         """Custom callback to log parameter values."""
+        # Build all lines first and emit them with a single write per snapshot
+        lines = []
         for idx, val in snapshot.values.items():
-            config = controller.get_parameter_config(idx)
+            config = config_by_index.get(idx)
             if config:
                 raw_val = snapshot.raw_values[idx]
-                print(
-                    f"[MONITOR] {config.name}: {val:.4f} normalized ({raw_val:.2f} {config.unit})"
+                lines.append(
+                    "[MONITOR] %s: %.4f normalized (%.2f %s)\n"
+                    % (config.name, val, raw_val, config.unit)
                 )
+        if lines:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
 
     # Register custom callback (runs alongside rule engine)
     controller.poller.add_callback(monitor_callback)
@@ -288,8 +299,6 @@ def manual_control_example():
 
 
 if __name__ == "__main__":
-    import argparse
-
     parser = argparse.ArgumentParser(description="Audio Analysis Controller Examples")
     parser.add_argument(
         "example",
@@ -311,6 +320,4 @@ if __name__ == "__main__":
         print("\nInterrupted by user")
     except Exception as e:
         print(f"\nError: {e}")
-        import traceback
-
         traceback.print_exc()
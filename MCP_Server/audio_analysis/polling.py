@@ -8,19 +8,207 @@ This module provides the polling infrastructure that reads audio analysis parame
 from VST plugins and dispatches them to rule engines for decision-making.
 """
 
+import os
+import sys
 import time
+import errno
+import heapq
+import json
+import ctypes
+import ctypes.util
 import threading
-from typing import Callable, Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 from dataclasses import dataclass
-from collections import deque
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+import numpy as np
+
+# Library logger; the application decides where (and whether) records go
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Optional JIT compiler for the per-poll normalization kernel
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @njit("void(float64[:], float64[:], float64[:], float64[:])", cache=True)
+    def _normalize(raw, min_values, scale, out):
+        """Min-max normalize raw into out: (raw - min) * scale"""
+        for i in range(raw.size):
+            out[i] = (raw[i] - min_values[i]) * scale[i]
+
+else:
+
+    def _normalize(raw, min_values, scale, out):
+        """Min-max normalize raw into out: (raw - min) * scale"""
+        np.subtract(raw, min_values, out=out)
+        np.multiply(out, scale, out=out)
+
+
+def _parameter_values(result: Any) -> np.ndarray:
+    """
+    Device parameter values from a parameter tool response
 
+    Accepts get_device_parameter_values' ``{"values": [...]}`` and
+    get_device_parameters' ``{"parameters": [...]}`` (or a bare list of
+    parameter dicts). The latter only lists enabled parameters, each with its
+    device ``index``; left-out parameters become NaN so that both tools index
+    values the same way, like ``device.parameters``.
 
-@dataclass
+    Raises:
+        RuntimeError: If the tool returned error text instead of data
+    """
+    if isinstance(result, str):
+        try:
+            result = json.loads(result)  # Tools return JSON text
+        except ValueError:
+            raise RuntimeError(result) from None  # Failures are plain text
+    if isinstance(result, dict):
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        if "values" in result:
+            return np.asarray(result["values"], dtype=np.float64)
+        result = result["parameters"]
+    if isinstance(result, np.ndarray):
+        return result.astype(np.float64, copy=False)
+    if len(result) and isinstance(result[0], dict):
+        indices = [param.get("index", pos) for pos, param in enumerate(result)]
+        values = np.full(max(indices) + 1, np.nan)
+        values[indices] = [param.get("value", 0.0) for param in result]
+        return values
+    return np.asarray(result, dtype=np.float64)
+
+
+def _is_unknown_command(error: Any) -> bool:
+    """Whether an MCP error says the tool/command does not exist at all"""
+    text = str(error).lower()
+    return "unknown command" in text or "unknown tool" in text
+
+
+class _Timespec(ctypes.Structure):
+    """C ``struct timespec`` for clock_nanosleep"""
+
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+_CLOCK_MONOTONIC = 1  # Same clock as time.monotonic_ns() on Linux
+_TIMER_ABSTIME = 1
+
+
+def _load_clock_nanosleep() -> Optional[Callable]:
+    """Return libc clock_nanosleep on Linux, or None where unavailable"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+        func = libc.clock_nanosleep
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.POINTER(_Timespec),
+        ctypes.c_void_p,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+_clock_nanosleep = _load_clock_nanosleep()
+_STOP_SLICE_NS = 10_000_000  # Longest clock_nanosleep before checking a stop event
+
+
+def _sleep_until(
+    deadline_ns: int,
+    stop_event: Optional[threading.Event] = None,
+    spin_ns: int = 0,
+) -> bool:
+    """
+    Sleep until an absolute monotonic deadline
+
+    Uses clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME) where available so
+    wake-ups do not accumulate drift; falls back to Event.wait()/time.sleep()
+    elsewhere. With a stop event, clock_nanosleep sleeps in absolute slices
+    of at most _STOP_SLICE_NS and checks the event between them, so stopping
+    takes at most one slice.
+
+    Args:
+        deadline_ns: Deadline in time.monotonic_ns() units
+        stop_event: Optional event that interrupts the sleep
+        spin_ns: Busy-wait the last spin_ns before the deadline instead of
+            sleeping, to avoid OS timer slack at high rates
+
+    Returns:
+        True if the stop event was set, False when the deadline was reached
+    """
+    sleep_deadline_ns = deadline_ns - spin_ns
+
+    if _clock_nanosleep is not None:
+        wake_ns = sleep_deadline_ns
+        while True:
+            if stop_event is not None:
+                if stop_event.is_set():
+                    return True
+                wake_ns = min(
+                    sleep_deadline_ns, time.monotonic_ns() + _STOP_SLICE_NS
+                )
+            ts = _Timespec(wake_ns // 1_000_000_000, wake_ns % 1_000_000_000)
+            # Absolute deadline, so an interrupted sleep can simply be retried
+            while (
+                _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ts, None)
+                == errno.EINTR
+            ):
+                pass
+            if wake_ns >= sleep_deadline_ns:
+                break
+    elif stop_event is not None:
+        timeout_ns = max(0, sleep_deadline_ns - time.monotonic_ns())
+        if stop_event.wait(timeout_ns / 1e9):
+            return True
+    else:
+        remaining_ns = sleep_deadline_ns - time.monotonic_ns()
+        if remaining_ns > 0:
+            time.sleep(remaining_ns / 1e9)
+
+    if spin_ns:
+        while time.monotonic_ns() < deadline_ns:
+            pass
+    return False
+
+
+def _set_windows_timer_period(enable: bool) -> None:
+    """Raise (or restore) the Windows system timer resolution to 1 ms"""
+    if sys.platform != "win32":
+        return
+    try:
+        winmm = ctypes.WinDLL("winmm")
+        if enable:
+            winmm.timeBeginPeriod(1)
+        else:
+            winmm.timeEndPeriod(1)
+    except (OSError, AttributeError):
+        pass
+
+
+@dataclass(slots=True)
 class ParameterConfig:
     """Configuration for a monitored parameter"""
 
@@ -31,57 +219,335 @@ class ParameterConfig:
     unit: str = ""  # Unit (e.g., "LUFS", "dB", "Hz")
 
 
-@dataclass
+def _is_dense_layout(indices: List[Any]) -> bool:
+    """Whether values for these parameter indices fit a dense array cheaply
+
+    Dense arrays are indexed directly by parameter index, so they are only
+    used when the indices are small non-negative ints without large gaps.
+    """
+    if not all(type(i) is int and i >= 0 for i in indices):
+        return False
+    return max(indices, default=-1) < 4 * len(indices) + 64
+
+
+class ParameterValues(Mapping):
+    """
+    Read-only mapping of parameter index -> value backed by a numpy array
+
+    Behaves like the Dict[int, float] that snapshots used to carry, while the
+    values live in one contiguous array (``array``) that can be stacked or
+    reduced directly. ``index_map`` (param index -> array position) is shared
+    by all snapshots produced by the same poller. When ``dense`` is True the
+    array is indexed by parameter index itself, with NaN for parameters that
+    were not polled, so ``array[param_index]`` needs no lookup.
+
+    Arrays are float64 rather than float32: rule thresholds are Python
+    floats, and a float32 0.7 reads back as 0.699999988, which fails a
+    ``>= 0.7`` condition. Bulk history storage, where that does not
+    matter, uses float32 (see CircularBuffer).
+    """
+
+    __slots__ = ("index_map", "array", "dense")
+
+    def __init__(
+        self, index_map: Dict[int, int], array: np.ndarray, dense: bool = False
+    ):
+        self.index_map = index_map
+        self.array = array
+        self.dense = dense
+
+    @classmethod
+    def from_dict(cls, values: Mapping[int, float]) -> "ParameterValues":
+        """Build from a plain {param_index: value} mapping"""
+        indices = list(values)
+        if _is_dense_layout(indices):
+            array = np.full(max(indices, default=-1) + 1, np.nan)
+            array[indices] = list(values.values())
+            return cls({i: i for i in indices}, array, dense=True)
+        index_map = {index: pos for pos, index in enumerate(indices)}
+        array = np.fromiter(values.values(), dtype=np.float64, count=len(index_map))
+        return cls(index_map, array)
+
+    def __getitem__(self, param_index: int) -> float:
+        return float(self.array[self.index_map[param_index]])
+
+    def get(self, param_index: int, default: Optional[float] = None):
+        pos = self.index_map.get(param_index)
+        return default if pos is None else float(self.array[pos])
+
+    def __contains__(self, param_index: object) -> bool:
+        return param_index in self.index_map
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.index_map)
+
+    def __len__(self) -> int:
+        return len(self.index_map)
+
+    def items(self):
+        values = self.array.tolist()
+        return [(index, values[pos]) for index, pos in self.index_map.items()]
+
+    def values(self):
+        values = self.array.tolist()
+        return [values[pos] for pos in self.index_map.values()]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+@dataclass(slots=True)
 class ParameterSnapshot:
-    """Snapshot of parameter values at a specific time"""
+    """
+    Snapshot of parameter values at a specific time
+
+    ``values`` and ``raw_values`` accept plain dicts and are stored as
+    array-backed ParameterValues mappings. Pollers also record which
+    parameters changed since their previously published snapshot
+    (``changed_indices``, relative to the snapshot captured at
+    ``previous_ns``); both are None when unknown.
+
+    Snapshots handed to poller callbacks are borrowed: the poller refills
+    them in place once they leave its buffer. Use ``copy()`` to keep one.
+    """
 
     timestamp: float  # Unix timestamp
-    values: Dict[int, float]  # Normalized values by param index
-    raw_values: Dict[int, float]  # Raw values by param index
+    values: ParameterValues  # Normalized values by param index
+    raw_values: ParameterValues  # Raw values by param index
     analysis: Optional[Dict[str, Any]] = None  # Optional audio analysis data
+    monotonic_ns: Optional[int] = None  # time.monotonic_ns() when captured
+    changed_indices: Optional[FrozenSet[int]] = None  # Changed since previous_ns
+    previous_ns: Optional[int] = None  # monotonic_ns of the snapshot compared to
+
+    def __post_init__(self):
+        if self.monotonic_ns is None:
+            # Map the wall-clock timestamp onto the monotonic clock
+            age_ns = int((time.time() - self.timestamp) * 1e9)
+            self.monotonic_ns = time.monotonic_ns() - age_ns
+        if not isinstance(self.values, ParameterValues):
+            self.values = ParameterValues.from_dict(self.values)
+        if not isinstance(self.raw_values, ParameterValues):
+            self.raw_values = ParameterValues.from_dict(self.raw_values)
+
+    def get(self, param_index: int) -> Optional[float]:
+        """Get normalized value for a parameter index, or None if not polled"""
+        return self.values.get(param_index)
+
+    def copy(self) -> "ParameterSnapshot":
+        """Independent copy that is never recycled by a poller"""
+        values = self.values
+        raw_values = self.raw_values
+        return ParameterSnapshot(
+            timestamp=self.timestamp,
+            values=ParameterValues(
+                values.index_map, values.array.copy(), values.dense
+            ),
+            raw_values=ParameterValues(
+                raw_values.index_map, raw_values.array.copy(), raw_values.dense
+            ),
+            analysis=self.analysis,
+            monotonic_ns=self.monotonic_ns,
+            changed_indices=self.changed_indices,
+            previous_ns=self.previous_ns,
+        )
 
 
 class CircularBuffer:
-    """Circular buffer for storing time-series parameter history"""
+    """
+    Circular buffer for storing time-series parameter history
+
+    Single-producer ring buffer: only one thread (the poll thread) may push,
+    while any number of readers access it without locking. The writer fills
+    a slot and then publishes it by advancing ``_write``; readers snapshot
+    ``_write`` once and discard any slots the writer overwrote meanwhile.
+
+    The buffer also keeps a pool of ``max_size + 1`` recently pushed
+    snapshots that the producer may recycle in place via ``next_slot()``.
+    The extra entry means a recycled snapshot has always left the ring
+    already. Readers still get copies (``get_latest()``, ``get_time_range()``,
+    ``get_closest()``), since the snapshots they hold would otherwise change
+    under them once recycled.
+
+    With a ``width``, the value arrays themselves live in two preallocated
+    ``(max_size + 1, width)`` matrices, one row per pool entry, so the
+    history can be read as contiguous arrays (``get_arrays()``) instead of
+    walking snapshot objects. Raw values are only displayed to a couple of
+    decimals, so their history is kept as float32 copies at half the size.
+    """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, width: int = 0):
         """
         Initialize circular buffer
 
         Args:
             max_size: Maximum number of snapshots to store
+            width: Length of the snapshots' value arrays (0: no row storage)
         """
         self.max_size = max_size
-        self.buffer: deque = deque(maxlen=max_size)
-        self.lock = threading.Lock()
+        self.width = width
+        self._slots: List[Optional[ParameterSnapshot]] = [None] * max_size
+        self._monotonic_ns = np.zeros(max_size, dtype=np.int64)
+        self._write = 0  # Total pushes; only advanced by the producer
+        self._pool: List[Optional[ParameterSnapshot]] = [None] * (max_size + 1)
+
+        # Row storage by pool position; the row views are created once so
+        # push() can tell by identity whether a snapshot already uses them
+        self._raw_rows = np.full((max_size + 1, width), np.nan, dtype=np.float32)
+        self._value_rows = np.full((max_size + 1, width), np.nan)
+        self._raw_row_views = list(self._raw_rows) if width else []
+        self._value_row_views = list(self._value_rows) if width else []
+
+    def next_slot(self) -> Optional[ParameterSnapshot]:
+        """
+        Get the evicted snapshot the producer may overwrite for its next push
+
+        Returns:
+            A snapshot no longer held by the ring, or None while the pool is
+            still filling up
+        """
+        return self._pool[self._write % (self.max_size + 1)]
+
+    def next_row(self) -> Optional[np.ndarray]:
+        """
+        Get the normalized-value row the producer may fill for its next push
+
+        Returns:
+            Row view of the preallocated storage, or None without row storage
+        """
+        if not self.width:
+            return None
+        return self._value_row_views[self._write % (self.max_size + 1)]
 
     def push(self, snapshot: ParameterSnapshot):
-        """Add snapshot to buffer"""
-        with self.lock:
-            self.buffer.append(snapshot)
+        """Add snapshot to buffer (producer thread only)"""
+        i = self._write % self.max_size
+        p = self._write % (self.max_size + 1)
+        if self.width:
+            # Mirror arrays that were not built in place (e.g. pushed dicts)
+            self._store_row(self._raw_row_views[p], snapshot.raw_values.array)
+            self._store_row(self._value_row_views[p], snapshot.values.array)
+        self._pool[p] = snapshot
+        self._slots[i] = snapshot
+        self._monotonic_ns[i] = snapshot.monotonic_ns
+        self._write += 1  # Publish the slot
+
+    @staticmethod
+    def _store_row(row: np.ndarray, array: np.ndarray):
+        if array is row:
+            return
+        if array.shape == row.shape:
+            np.copyto(row, array)  # Casts raw values down to float32
+        else:
+            row.fill(np.nan)  # Different layout: not representable as a row
+
+    def _read_range(self, start: int, end: int) -> List[ParameterSnapshot]:
+        """Copy snapshots [start, end) by push count, dropping overwritten ones"""
+        slots = self._slots
+        max_size = self.max_size
+        # At most two contiguous slices of the slot list
+        first = start % max_size
+        last = first + (end - start)
+        if last <= max_size:
+            result = slots[first:last]
+        else:
+            result = slots[first:] + slots[: last - max_size]
+        result = [snapshot.copy() for snapshot in result]
+        # Checked after copying: anything evicted meanwhile may be refilled
+        overwritten = self._write - max_size - start
+        if overwritten > 0:
+            result = result[overwritten:]
+        return result
 
     def get_latest(self, n: int = 1) -> List[ParameterSnapshot]:
-        """Get n most recent snapshots"""
-        with self.lock:
-            return (
-                list(self.buffer)[-n:] if len(self.buffer) >= n else list(self.buffer)
-            )
+        """Get copies of the n most recent snapshots"""
+        end = self._write
+        count = min(max(n, 0), end, self.max_size)
+        return self._read_range(end - count, end)
+
+    def get_arrays(
+        self, n: int, raw: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the n most recent snapshots as arrays (oldest first)
+
+        Args:
+            n: Number of snapshots
+            raw: Return raw instead of normalized values
+
+        Returns:
+            (monotonic_ns of shape (k,), values of shape (k, width)) copies;
+            raw values are float32
+        """
+        end = self._write
+        count = min(max(n, 0), end, self.max_size)
+        start = end - count
+        pushes = np.arange(start, end)
+        rows = self._raw_rows if raw else self._value_rows
+        values = rows[pushes % (self.max_size + 1)]
+        stamps = self._monotonic_ns[pushes % self.max_size]
+        overwritten = self._write - self.max_size - start
+        if overwritten > 0:  # Refilled by the producer while copying
+            values = values[overwritten:]
+            stamps = stamps[overwritten:]
+        return stamps, values
 
     def get_time_range(self, duration_seconds: float) -> List[ParameterSnapshot]:
-        """Get snapshots within time duration"""
-        cutoff_time = time.time() - duration_seconds
-        with self.lock:
-            return [s for s in self.buffer if s.timestamp >= cutoff_time]
+        """Get copies of the snapshots within time duration"""
+        cutoff_ns = time.monotonic_ns() - int(duration_seconds * 1e9)
+        end = self._write
+        start = end - min(end, self.max_size)
+        # Slot timestamps are in push order: find the first kept one and
+        # copy only from there
+        stamps = self._monotonic_ns[np.arange(start, end) % self.max_size]
+        first = int(np.searchsorted(stamps, cutoff_ns))
+        if first >= len(stamps):
+            return []
+        return self._read_range(start + first, end)
+
+    def get_closest(
+        self, target_ns: int, min_ns: Optional[int] = None
+    ) -> Optional[ParameterSnapshot]:
+        """
+        Get the snapshot captured closest to a monotonic time
+
+        Binary-searches the slot timestamps, which are in push (time) order.
+
+        Args:
+            target_ns: Target time in time.monotonic_ns() units
+            min_ns: Ignore snapshots captured before this time
+
+        Returns:
+            Copy of the closest snapshot, or None if no snapshot qualifies
+        """
+        end = self._write
+        start = end - min(end, self.max_size)
+        stamps = self._monotonic_ns[np.arange(start, end) % self.max_size]
+
+        lo = 0 if min_ns is None else int(np.searchsorted(stamps, min_ns))
+        if lo >= len(stamps):
+            return None
+
+        i = int(np.searchsorted(stamps, target_ns))
+        if i >= len(stamps) or (
+            i > lo and target_ns - stamps[i - 1] <= stamps[i] - target_ns
+        ):
+            i -= 1
+        i = max(i, lo)
+
+        snapshot = self._slots[(start + i) % self.max_size].copy()
+        if self._write - self.max_size > start + i:
+            return None  # Overwritten while searching or copying
+        return snapshot
 
     def clear(self):
         """Clear buffer"""
-        with self.lock:
-            self.buffer.clear()
+        self._write = 0
+        self._slots = [None] * self.max_size
+        self._pool = [None] * (self.max_size + 1)
 
     def size(self) -> int:
         """Get current buffer size"""
-        with self.lock:
-            return len(self.buffer)
+        return min(self._write, self.max_size)
 
 
 class AudioAnalysisPoller:
@@ -100,6 +566,9 @@ class AudioAnalysisPoller:
         update_rate_hz: float = 10.0,
         buffer_size: int = 1000,
         mcp_client: Optional[Any] = None,
+        cpu_affinity: Optional[int] = None,
+        sched_priority: Optional[int] = None,
+        dedup_epsilon: Optional[float] = None,
     ):
         """
         Initialize audio analysis poller
@@ -111,19 +580,36 @@ class AudioAnalysisPoller:
             update_rate_hz: Polling frequency in Hz (default: 10 Hz)
             buffer_size: Max snapshots in circular buffer
             mcp_client: MCP client instance for accessing Ableton (injected)
+            cpu_affinity: Optional CPU to pin the poll thread to (Linux)
+            sched_priority: Optional SCHED_FIFO priority for the poll thread
+                (Linux; needs CAP_SYS_NICE or root)
+            dedup_epsilon: If set, skip buffering and callbacks for snapshots
+                whose normalized values are all within this tolerance of the
+                last published snapshot (default: None, publish every poll)
         """
         self.track_index = track_index
         self.device_index = device_index
         self.params_to_poll = {p.index: p for p in params_to_poll}  # index -> config
+        self._build_normalization()
         self.update_rate_hz = update_rate_hz
         self.update_interval = 1.0 / update_rate_hz
-        self.buffer = CircularBuffer(max_size=buffer_size)
+        # Above 50 Hz, spin out the last 200 us of each interval for precision
+        self._spin_margin_ns = 200_000 if update_rate_hz > 50 else 0
+        self.buffer = CircularBuffer(max_size=buffer_size, width=self._size)
         self.mcp_client = mcp_client
         self.analysis_provider = None
+        self.cpu_affinity = cpu_affinity
+        self.sched_priority = sched_priority
+        self.dedup_epsilon = dedup_epsilon
+        self._last_values: Optional[np.ndarray] = None  # Last published values
+        self._last_ns: Optional[int] = None  # monotonic_ns of last published
+        self._values_endpoint = True  # Cleared if the server lacks the tool
 
         # State
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._managed = False  # True when a MultiPluginPoller drives polling
         self.latest_snapshot: Optional[ParameterSnapshot] = None
 
         # Callbacks for rule engine integration
@@ -131,10 +617,49 @@ class AudioAnalysisPoller:
 
         # Performance tracking
         self.last_poll_time: Optional[float] = None
+        self.start_time: Optional[float] = None  # Unix time of last start()
+        self._start_time_ns = 0  # time.monotonic_ns() of last start()
         self.poll_count = 0
+        self.dedup_count = 0
+        self._last_warn_ns = 0  # Rate-limits overrun warnings to one per second
+
+    def _build_normalization(self):
+        """Precompute per-parameter arrays for vectorized normalization"""
+        configs = list(self.params_to_poll.values())
+        self._indices = [c.index for c in configs]
+        self._idx_array = np.array(self._indices, dtype=np.int64)
+        self._max_index = max(self._indices, default=-1)
+
+        # Array position of each polled parameter: its own index when dense
+        self._dense = _is_dense_layout(self._indices)
+        if self._dense:
+            self._positions = self._idx_array
+            self._size = self._max_index + 1
+        else:
+            self._positions = np.arange(len(configs), dtype=np.int64)
+            self._size = len(configs)
+        self._index_map = dict(zip(self._indices, self._positions.tolist()))
+        # Parameter index stored at each array position (-1 for gaps)
+        self._position_index = np.full(self._size, -1, dtype=np.int64)
+        self._position_index[self._positions] = self._idx_array
+
+        min_values = np.array([c.min_value for c in configs], dtype=np.float64)
+        ranges = np.array(
+            [c.max_value - c.min_value for c in configs], dtype=np.float64
+        )
+        valid = ranges > 0
+        # Parameters without a valid range pass through unchanged (min 0, scale 1)
+        self._min = np.zeros(self._size)
+        self._min[self._positions] = np.where(valid, min_values, 0.0)
+        self._scale = np.ones(self._size)
+        self._scale[self._positions] = np.divide(
+            1.0, ranges, out=np.ones_like(ranges), where=valid
+        )
+        # Already-normalized (0-1) parameters need no arithmetic at all
+        self._passthrough = bool(np.all((self._min == 0.0) & (self._scale == 1.0)))
 
     def add_callback(self, callback: Callable[[ParameterSnapshot], None]):
-        """Register callback to receive parameter snapshots"""
+        """Register callback to receive (borrowed) parameter snapshots"""
         if callback not in self.callbacks:
             self.callbacks.append(callback)
             logger.debug(f"Registered callback: {callback.__name__}")
@@ -161,6 +686,14 @@ class AudioAnalysisPoller:
         )
 
         self.running = True
+        self._stop_event.clear()
+        self.start_time = time.time()
+        self._start_time_ns = time.monotonic_ns()
+        if self._managed:
+            # Polled by the owning MultiPluginPoller; no thread of our own
+            return
+        if self._spin_margin_ns:
+            _set_windows_timer_period(True)
         self.thread = threading.Thread(target=self._poll_loop, daemon=True)
         self.thread.start()
 
@@ -171,63 +704,173 @@ class AudioAnalysisPoller:
 
         logger.info("Stopping poller...")
         self.running = False
+        self._stop_event.set()  # Wakes the poll thread out of its wait
 
         if self.thread:
             self.thread.join(timeout=2.0)
 
             if self.thread.is_alive():
                 logger.warning("Poller thread did not stop gracefully")
+            self.thread = None
+            if self._spin_margin_ns:
+                _set_windows_timer_period(False)
 
         logger.info(
             f"Poller stopped. Total polls: {self.poll_count}, "
             f"Avg rate: {self._calculate_actual_rate():.2f} Hz"
         )
 
+    def _apply_thread_scheduling(self):
+        """Pin and prioritize the calling (poll) thread if configured"""
+        if self.cpu_affinity is not None:
+            try:
+                os.sched_setaffinity(0, {self.cpu_affinity})
+            except (AttributeError, OSError) as e:
+                logger.warning(
+                    f"Could not pin poll thread to CPU {self.cpu_affinity}: {e}"
+                )
+
+        if self.sched_priority is not None:
+            try:
+                os.sched_setscheduler(
+                    0, os.SCHED_FIFO, os.sched_param(self.sched_priority)
+                )
+            except (AttributeError, OSError) as e:
+                logger.warning(
+                    f"Could not set SCHED_FIFO priority {self.sched_priority} "
+                    f"(requires CAP_SYS_NICE): {e}"
+                )
+
     def _poll_loop(self):
         """Main polling loop (runs in separate thread)"""
         logger.debug("Poll loop started")
+        self._apply_thread_scheduling()
 
-        while self.running:
-            poll_start = time.time()
+        # Pace against absolute deadlines so per-iteration jitter never accumulates
+        interval_ns = int(self.update_interval * 1e9)
+        next_deadline = time.monotonic_ns() + interval_ns
 
-            try:
-                # Poll parameters
-                snapshot = self._poll_parameters()
+        # Fetch and publish in the same iteration. Only when a fetch outlasts
+        # the interval does a dedicated IPC worker start the next fetch while
+        # this thread processes the current response.
+        ipc: Optional[ThreadPoolExecutor] = None
+        pending = None  # Future of the overlapped fetch, if any
 
-                if snapshot:
-                    # Store in buffer
-                    self.buffer.push(snapshot)
-                    self.latest_snapshot = snapshot
+        stop_event = self._stop_event
+        while not stop_event.is_set():
+            poll_start_ns = time.monotonic_ns()
 
-                    # Notify callbacks (rule engine)
-                    for callback in self.callbacks:
-                        try:
-                            callback(snapshot)
-                        except Exception as e:
-                            logger.error(f"Callback error: {e}", exc_info=True)
+            try:
+                if pending is not None:
+                    fetched, fetch_ns = pending.result()
+                    pending = None
+                else:
+                    fetched, fetch_ns = self._timed_fetch()
+
+                if fetch_ns > interval_ns:
+                    if ipc is None:
+                        ipc = ThreadPoolExecutor(
+                            max_workers=1,
+                            thread_name_prefix="mcp-ipc",
+                            initializer=self._apply_thread_scheduling,
+                        )
+                    pending = ipc.submit(self._timed_fetch)
 
-                # Update performance tracking
-                self.last_poll_time = time.time()
-                self.poll_count += 1
+                self._publish(None if fetched is None else self._process_raw(*fetched))
 
                 # Sleep to maintain target rate
-                elapsed = time.time() - poll_start
-                sleep_time = self.update_interval - elapsed
+                now = time.monotonic_ns()
+                if now >= next_deadline:
+                    if now - self._last_warn_ns > 1_000_000_000:
+                        self._last_warn_ns = now
+                        elapsed = (now - poll_start_ns) / 1e9
+                        logger.warning(
+                            f"Poll took {elapsed * 1000:.1f}ms, exceeding interval {self.update_interval * 1000:.1f}ms"
+                        )
+                    # Skip ahead to the next aligned slot rather than catching up
+                    missed = (now - next_deadline) // interval_ns + 1
+                    next_deadline += missed * interval_ns
 
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                else:
-                    logger.warning(
-                        f"Poll took {elapsed * 1000:.1f}ms, exceeding interval {self.update_interval * 1000:.1f}ms"
-                    )
+                if _sleep_until(next_deadline, stop_event, self._spin_margin_ns):
+                    break
+                next_deadline += interval_ns
 
             except Exception as e:
                 logger.error(f"Polling error: {e}", exc_info=True)
                 # Sleep to avoid tight error loop
-                time.sleep(0.1)
+                stop_event.wait(0.1)
 
+        if pending is not None:
+            # Publish the overlapped fetch rather than dropping it
+            try:
+                fetched, _ = pending.result()
+                if fetched is not None:
+                    self._publish(self._process_raw(*fetched))
+            except Exception as e:
+                logger.error(f"Polling error: {e}", exc_info=True)
+        if ipc is not None:
+            ipc.shutdown(wait=False)
         logger.debug("Poll loop stopped")
 
+    def _publish(self, snapshot: Optional[ParameterSnapshot]):
+        """Store a polled snapshot, notify callbacks and update poll statistics"""
+        if snapshot and self._track_changes(snapshot):
+            snapshot = None
+            self.dedup_count += 1
+
+        if snapshot:
+            # Store in buffer
+            self.buffer.push(snapshot)
+            self.latest_snapshot = snapshot
+
+            # Notify callbacks (rule engine)
+            for callback in self.callbacks:
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    # Tracebacks only at debug level; formatting them is costly
+                    logger.error(
+                        f"Callback error: {e}",
+                        exc_info=logger.isEnabledFor(logging.DEBUG),
+                    )
+
+        # Update performance tracking
+        self.last_poll_time = time.time()
+        self.poll_count += 1
+
+    def _track_changes(self, snapshot: ParameterSnapshot) -> bool:
+        """
+        Compare a snapshot with the last published one
+
+        Records which parameters changed on the snapshot (changed_indices)
+        and remembers it as the last published one.
+
+        Returns:
+            True if the snapshot is a duplicate under dedup_epsilon and
+            should not be published
+        """
+        values = snapshot.values.array
+        last = self._last_values
+        if last is None or last.shape != values.shape:
+            # Copy, since pooled snapshot arrays are recycled in place
+            self._last_values = values.copy()
+            changed = None
+        else:
+            if self.dedup_epsilon is not None and np.allclose(
+                values, last, rtol=0.0, atol=self.dedup_epsilon, equal_nan=True
+            ):
+                return True
+            changed = None
+            if snapshot.values.index_map is self._index_map:
+                indices = self._position_index[np.flatnonzero(values != last)]
+                changed = frozenset(indices[indices >= 0].tolist())
+            np.copyto(last, values)
+
+        snapshot.changed_indices = changed
+        snapshot.previous_ns = self._last_ns if changed is not None else None
+        self._last_ns = snapshot.monotonic_ns
+        return False
+
     def _poll_parameters(self) -> Optional[ParameterSnapshot]:
         """
         Poll parameters from VST device
@@ -235,37 +878,123 @@ class AudioAnalysisPoller:
         Returns:
             ParameterSnapshot with current values, or None on error
         """
+        fetched = self._fetch_parameters()
+        return None if fetched is None else self._process_raw(*fetched)
+
+    def _fetch_parameters(self) -> Optional[tuple]:
+        """
+        Fetch raw device parameters over MCP
+
+        Prefers the values-only tool, which returns one float per device
+        parameter, and switches to the full get_device_parameters tool for
+        good once the server reports the former as unknown. Other errors
+        (timeouts, missing devices) just fail this poll.
+
+        Returns:
+            (values, timestamp, monotonic_ns) captured when the response
+            arrived, or None on error. values is a float array indexed like
+            device.parameters for either tool.
+        """
         if self.mcp_client is None:
             logger.warning("MCP client not configured, no polling possible")
             return None
 
+        device = {"track_index": self.track_index, "device_index": self.device_index}
+        if self._values_endpoint:
+            try:
+                result = self.mcp_client.call_tool(
+                    "ableton-mcp-server_get_device_parameter_values", device
+                )
+                values = _parameter_values(result)
+                return values, time.time(), time.monotonic_ns()
+            except Exception as e:
+                if not _is_unknown_command(e):
+                    logger.error(f"Failed to poll parameters: {e}", exc_info=True)
+                    return None
+                self._values_endpoint = False
+                logger.info(
+                    f"Parameter values tool unavailable ({e}), "
+                    "using get_device_parameters"
+                )
+
         try:
             # Call MCP tool to get device parameters
-            params = self.mcp_client.call_tool(
-                "ableton-mcp-server_get_device_parameters",
-                {"track_index": self.track_index, "device_index": self.device_index},
+            result = self.mcp_client.call_tool(
+                "ableton-mcp-server_get_device_parameters", device
             )
+            values = _parameter_values(result)
+        except Exception as e:
+            logger.error(f"Failed to poll parameters: {e}", exc_info=True)
+            return None
 
-            # Extract monitored parameter values
-            raw_values = {}
-            normalized_values = {}
-
-            for index, config in self.params_to_poll.items():
-                if index < len(params):
-                    raw_value = params[index].get("value", 0.0)
-                    raw_values[index] = raw_value
-
-                    # Normalize to 0.0-1.0 range
-                    if config.max_value > config.min_value:
-                        normalized = (raw_value - config.min_value) / (
-                            config.max_value - config.min_value
-                        )
-                        normalized_values[index] = normalized
-                    else:
-                        normalized_values[index] = raw_value
+        return values, time.time(), time.monotonic_ns()
 
-                else:
+    def _timed_fetch(self) -> Tuple[Optional[tuple], int]:
+        """Fetch parameters, returning (_fetch_parameters() result, duration_ns)"""
+        start_ns = time.monotonic_ns()
+        fetched = self._fetch_parameters()
+        return fetched, time.monotonic_ns() - start_ns
+
+    def _process_raw(
+        self,
+        params: Any,
+        timestamp: Optional[float] = None,
+        monotonic_ns: Optional[int] = None,
+    ) -> Optional[ParameterSnapshot]:
+        """
+        Build a snapshot from a raw parameter tool result
+
+        Args:
+            params: Device parameter values (array, indexed like
+                device.parameters) or any response _parameter_values accepts
+            timestamp: Unix time the parameters were read (default: now)
+            monotonic_ns: time.monotonic_ns() when read (default: now)
+
+        Returns:
+            ParameterSnapshot with current values, or None on error
+        """
+        try:
+            if not isinstance(params, np.ndarray):
+                params = _parameter_values(params)
+
+            # Extract monitored parameter values
+            index_map = self._index_map
+            indices = self._indices
+            idx_array = self._idx_array
+            positions = self._positions
+
+            # One bounds check per poll; only mask when the device is short
+            if self._max_index >= len(params):
+                available = idx_array < len(params)
+                for index in idx_array[~available].tolist():
                     logger.warning(f"Parameter index {index} not available from device")
+                idx_array = idx_array[available]
+                positions = positions[available]
+                indices = idx_array.tolist()
+                index_map = dict(zip(indices, positions.tolist()))
+
+            polled = params[idx_array]  # One gather for all monitored parameters
+
+            # Recycle an evicted snapshot of the same layout when possible;
+            # its unpolled slots are already NaN
+            snapshot = self.buffer.next_slot()
+            if snapshot is None or snapshot.values.index_map is not index_map:
+                snapshot = None
+                raw = np.full(self._size, np.nan)
+                # Normalize straight into the buffer's row when it has one
+                normalized = self.buffer.next_row()
+                if normalized is None:
+                    normalized = np.empty_like(raw)
+            else:
+                raw = snapshot.raw_values.array
+                normalized = snapshot.values.array
+            raw[positions] = polled
+
+            # Normalize to 0.0-1.0 range in a single pass
+            if self._passthrough:
+                normalized = raw  # Values are read-only, so sharing is safe
+            else:
+                _normalize(raw, self._min, self._scale, normalized)
 
             # Create snapshot with optional analysis data (if analyzer bound)
             analysis = None
@@ -277,13 +1006,25 @@ class AudioAnalysisPoller:
                         analysis = provided
                 except Exception:
                     analysis = None
-            snapshot = ParameterSnapshot(
-                timestamp=time.time(),
-                values=normalized_values,
-                raw_values=raw_values,
-                analysis=analysis,
-            )
-
+            if timestamp is None:
+                timestamp = time.time()
+            if monotonic_ns is None:
+                monotonic_ns = time.monotonic_ns()
+
+            if snapshot is None:
+                return ParameterSnapshot(
+                    timestamp=timestamp,
+                    monotonic_ns=monotonic_ns,
+                    values=ParameterValues(index_map, normalized, self._dense),
+                    raw_values=ParameterValues(index_map, raw, self._dense),
+                    analysis=analysis,
+                )
+
+            snapshot.timestamp = timestamp
+            snapshot.monotonic_ns = monotonic_ns
+            snapshot.analysis = analysis
+            snapshot.changed_indices = None  # Set again when published
+            snapshot.previous_ns = None
             return snapshot
 
         except Exception as e:
@@ -291,8 +1032,9 @@ class AudioAnalysisPoller:
             return None
 
     def get_latest_snapshot(self) -> Optional[ParameterSnapshot]:
-        """Get most recent parameter snapshot"""
-        return self.latest_snapshot
+        """Get a copy of the most recent parameter snapshot"""
+        snapshot = self.latest_snapshot
+        return snapshot.copy() if snapshot is not None else None
 
     def get_historical_snapshot(
         self, n_seconds_ago: float
@@ -306,32 +1048,35 @@ class AudioAnalysisPoller:
         Returns:
             Closest snapshot to requested time, or None
         """
-        snapshots = self.buffer.get_time_range(n_seconds_ago + 1.0)  # Buffer
-
-        if not snapshots:
-            return None
+        now_ns = time.monotonic_ns()
+        target_ns = now_ns - int(n_seconds_ago * 1e9)
+        min_ns = target_ns - 1_000_000_000  # Accept up to 1 s older (buffer)
 
-        # Find snapshot closest to requested time
-        target_time = time.time() - n_seconds_ago
-        closest = min(snapshots, key=lambda s: abs(s.timestamp - target_time))
-
-        return closest
+        return self.buffer.get_closest(target_ns, min_ns=min_ns)
 
     def get_history(self, n: int = 10) -> List[ParameterSnapshot]:
         """Get n most recent snapshots"""
         return self.buffer.get_latest(n)
 
+    def get_history_arrays(
+        self, n: int = 10, raw: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the n most recent snapshots as (monotonic_ns, values) arrays
+
+        Values have one column per array position of the snapshots' values
+        (``snapshot.values.index_map``), NaN where a parameter wasn't polled.
+        """
+        return self.buffer.get_arrays(n, raw=raw)
+
     def _calculate_actual_rate(self) -> float:
         """Calculate actual polling rate based on performance"""
-        if self.poll_count == 0 or self.last_poll_time is None:
+        if self.poll_count == 0 or self.start_time is None:
             return 0.0
 
-        # Rough estimate based on total polls
-        duration = time.time() - getattr(self, "start_time", time.time())
-        if duration <= 0:
-            return 0.0
-
-        return self.poll_count / duration
+        # Rough estimate based on total polls since start()
+        elapsed = (time.monotonic_ns() - self._start_time_ns) / 1e9
+        return self.poll_count / elapsed if elapsed > 0 else 0.0
 
     def get_status(self) -> Dict[str, Any]:
         """Get poller status and performance metrics"""
@@ -344,6 +1089,7 @@ class AudioAnalysisPoller:
             "parameters_polling": len(self.params_to_poll),
             "buffer_size": self.buffer.size(),
             "total_polls": self.poll_count,
+            "deduplicated_polls": self.dedup_count,
             "callbacks_registered": len(self.callbacks),
         }
 
@@ -352,13 +1098,28 @@ class MultiPluginPoller:
     """
     Manager for multiple pollers (multiple VST plugins/tracks)
     Coordinates polling across multiple audio analysis devices.
+
+    All managed pollers are driven from one scheduler thread rather than a
+    thread per poller.
     """
 
-    def __init__(self):
-        """Initialize multi-plugin poller manager"""
+    def __init__(self, mcp_client: Optional[Any] = None):
+        """
+        Initialize multi-plugin poller manager
+
+        Args:
+            mcp_client: Optional MCP client for batched polling. When given,
+                start_all() polls every device with one
+                batch_get_device_parameter_values call per tick. Otherwise each
+                poller is polled through its own client, soonest deadline
+                first.
+        """
         self.pollers: Dict[str, AudioAnalysisPoller] = {}  # name -> poller
         self.lock = threading.Lock()
         self.global_callbacks: List[Callable[[str, ParameterSnapshot], None]] = []
+        self.mcp_client = mcp_client
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
     def add_poller(self, name: str, poller: AudioAnalysisPoller):
         """Add poller to manager"""
@@ -371,7 +1132,10 @@ class MultiPluginPoller:
                     try:
                         callback(name, snapshot)
                     except Exception as e:
-                        logger.error(f"Global callback error: {e}", exc_info=True)
+                        logger.error(
+                            f"Global callback error: {e}",
+                            exc_info=logger.isEnabledFor(logging.DEBUG),
+                        )
 
             poller.add_callback(wrapper)
 
@@ -385,14 +1149,129 @@ class MultiPluginPoller:
     def start_all(self):
         """Start all managed pollers"""
         with self.lock:
-            for poller in self.pollers.values():
+            pollers = list(self.pollers.values())
+            for poller in pollers:
+                poller._managed = True
                 poller.start()
 
+            if pollers and self._thread is None:
+                if self.mcp_client is not None:
+                    target = self._batched_poll_loop
+                else:
+                    target = self._scheduled_poll_loop
+                self._stop_event.clear()
+                self._thread = threading.Thread(
+                    target=target, args=(pollers,), daemon=True
+                )
+                self._thread.start()
+
     def stop_all(self):
         """Stop all managed pollers"""
         with self.lock:
+            if self._thread is not None:
+                self._stop_event.set()
+                self._thread.join(timeout=2.0)
+                self._thread = None
+
             for poller in self.pollers.values():
                 poller.stop()
+                poller._managed = False  # May be started standalone again
+
+    def _scheduled_poll_loop(self, pollers: List[AudioAnalysisPoller]):
+        """Poll each device at its own rate from one thread (runs in thread)"""
+        # Min-heap of (deadline_ns, tiebreak, poller); pop the soonest due
+        now = time.monotonic_ns()
+        heap = [
+            (now + int(p.update_interval * 1e9), i, p)
+            for i, p in enumerate(pollers)
+        ]
+        heapq.heapify(heap)
+
+        stop_event = self._stop_event
+        while heap and not stop_event.is_set():
+            deadline, i, poller = heapq.heappop(heap)
+            if _sleep_until(deadline, stop_event, poller._spin_margin_ns):
+                break
+            if not poller.running:
+                continue  # Stopped individually; drop from the schedule
+
+            try:
+                poller._publish(poller._poll_parameters())
+            except Exception as e:
+                logger.error(f"Scheduled polling error: {e}", exc_info=True)
+
+            interval_ns = int(poller.update_interval * 1e9)
+            deadline += interval_ns
+            now = time.monotonic_ns()
+            if now >= deadline:
+                # Skip ahead to the next aligned slot rather than catching up
+                deadline += ((now - deadline) // interval_ns + 1) * interval_ns
+            heapq.heappush(heap, (deadline, i, poller))
+
+    def _batched_poll_loop(self, pollers: List[AudioAnalysisPoller]):
+        """Poll all devices with one batched MCP call per tick (runs in thread)"""
+        # Tick at the fastest requested rate
+        interval_ns = int(min(p.update_interval for p in pollers) * 1e9)
+        next_deadline = time.monotonic_ns() + interval_ns
+
+        stop_event = self._stop_event
+        while not stop_event.is_set():
+            try:
+                self._batched_poll(pollers)
+            except Exception as e:
+                logger.error(f"Batched polling error: {e}", exc_info=True)
+
+            now = time.monotonic_ns()
+            if now >= next_deadline:
+                missed = (now - next_deadline) // interval_ns + 1
+                next_deadline += missed * interval_ns
+
+            if _sleep_until(next_deadline, stop_event):
+                break
+            next_deadline += interval_ns
+
+    def _batched_poll(self, pollers: List[AudioAnalysisPoller]):
+        """Fetch parameters for all running pollers in one MCP call and dispatch them
+
+        Raises:
+            RuntimeError: If the tool failed or returned a result count that
+                does not match the request (nothing is published then)
+        """
+        # Pollers stopped individually get neither requests nor snapshots
+        pollers = [p for p in pollers if p.running]
+        if not pollers:
+            return
+        calls = [
+            {"track_index": p.track_index, "device_index": p.device_index}
+            for p in pollers
+        ]
+        results = self.mcp_client.call_tool(
+            "ableton-mcp-server_batch_get_device_parameter_values", {"calls": calls}
+        )
+        if isinstance(results, str):
+            try:
+                results = json.loads(results)  # Tools return JSON text
+            except ValueError:
+                raise RuntimeError(results) from None  # Failures are plain text
+        if isinstance(results, dict):
+            results = results.get("results", [])
+        if len(results) != len(pollers):
+            # Results are matched by position, so a short list is unusable
+            raise RuntimeError(
+                f"Batched poll returned {len(results)} results "
+                f"for {len(pollers)} devices"
+            )
+
+        for poller, result in zip(pollers, results):
+            try:
+                values = _parameter_values(result)
+            except (RuntimeError, KeyError, TypeError, ValueError) as e:
+                logger.warning(
+                    f"Batched poll failed for Track {poller.track_index}, "
+                    f"Device {poller.device_index}: {e}"
+                )
+                continue
+            poller._publish(poller._process_raw(values))
 
     def add_global_callback(self, callback: Callable[[str, ParameterSnapshot], None]):
         """Register callback to receive snapshots from all pollers"""
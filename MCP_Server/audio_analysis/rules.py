@@ -12,18 +12,149 @@ Architecture:
 - Supports cooldowns to prevent oscillation
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+import hashlib
+import json
+import math
+import operator as _op
+import os
 import time
-from typing import Optional, List, Dict, Any, Union
+import weakref
+from typing import Optional, List, Dict, Any, Union, Callable, FrozenSet
 import logging
 import yaml
 from pathlib import Path
 
-from .polling import ParameterSnapshot
+import numpy as np
+
+from .polling import ParameterSnapshot, ParameterValues
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT compiler for the bulk condition evaluator
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _safe_load(stream) -> Any:
+    """Parse YAML with safe_load semantics, using libyaml when available."""
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+# Parsed rule files kept in the cache; the least recently used go first
+_RULES_CACHE_SIZE = 32
+
+
+def _rules_cache_dir() -> Optional[Path]:
+    """Private directory for parsed-rule caches, or None to skip caching.
+
+    Uses the user cache dir only; there is deliberately no shared-tempdir
+    fallback. The directory is created 0700 and ignored unless it belongs
+    to the current user and is not writable by anyone else, so no other
+    user can plant cached rule definitions.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    if base:
+        path = Path(base) / "ableton-mcp" / "rules"
+    else:
+        try:
+            path = Path.home() / ".cache" / "ableton-mcp" / "rules"
+        except RuntimeError:  # No home directory could be determined
+            return None
+
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if hasattr(os, "getuid"):
+            st = path.stat()
+            if st.st_uid != os.getuid() or st.st_mode & 0o022:
+                logger.debug(f"Ignoring rule cache dir {path}: not private")
+                return None
+    except OSError:
+        return None
+    return path
+
+
+def _evict_rules_cache(cache_dir: Path) -> None:
+    """Delete the least recently used cache files beyond _RULES_CACHE_SIZE."""
+    try:
+        entries = [(p.stat().st_mtime_ns, p) for p in cache_dir.glob("*.json")]
+    except OSError:
+        return
+    if len(entries) <= _RULES_CACHE_SIZE:
+        return
+    entries.sort()
+    for _, stale in entries[: len(entries) - _RULES_CACHE_SIZE]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def _load_yaml_cached(yaml_path: Path) -> Any:
+    """Load a YAML file through a JSON cache.
+
+    The cache lives in a private user cache dir (``_rules_cache_dir()``),
+    one file per rule file named after a hash of its resolved path, and
+    holds at most _RULES_CACHE_SIZE files. Entries are keyed on the YAML
+    file's mtime and size and rewritten whenever either changes. Without a
+    usable cache dir, or when it cannot be read or written, the YAML is
+    simply parsed.
+    """
+    cache_dir = _rules_cache_dir()
+    if cache_dir is None:
+        with open(yaml_path, "rb") as f:
+            return _safe_load(f)
+
+    stat = yaml_path.stat()
+    resolved = str(yaml_path.resolve())
+    key = [resolved, stat.st_mtime_ns, stat.st_size]
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()
+    cache_path = cache_dir / f"{digest}.json"
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            os.utime(cache_path)  # Mark as recently used for eviction
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    # Hand raw bytes to the loader; libyaml detects the encoding itself
+    with open(yaml_path, "rb") as f:
+        data = _safe_load(f)
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        encoded = json.dumps({"key": key, "data": data})
+        # Only cache data that survives a JSON round trip unchanged
+        if json.loads(encoded)["data"] == data:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(encoded)
+            os.replace(tmp_path, cache_path)  # Atomic for concurrent loaders
+            _evict_rules_cache(cache_dir)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Not caching parsed rules for {yaml_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+    return data
+
 
 class Operator(Enum):
     """Comparison operators for rule conditions."""
@@ -38,6 +169,78 @@ class Operator(Enum):
     NOT_IN = "not_in"  # Not in list
 
 
+# Threshold types accepted by IN / NOT_IN
+_LIST_LIKE = (list, tuple, set, frozenset)
+
+
+def _in(value: Any, threshold: Any) -> bool:
+    # Only list-like thresholds are supported for IN; anything else fails
+    if isinstance(threshold, _LIST_LIKE):
+        return value in threshold
+    return False
+
+
+def _not_in(value: Any, threshold: Any) -> bool:
+    if isinstance(threshold, _LIST_LIKE):
+        return value not in threshold
+    return False
+
+
+_NAN = float("nan")
+
+# Comparator per operator, resolved once per Condition instead of per evaluation
+_OP_TABLE: Dict[Operator, Callable[[Any, Any], bool]] = {
+    Operator.GT: _op.gt,
+    Operator.GTE: _op.ge,
+    Operator.LT: _op.lt,
+    Operator.LTE: _op.le,
+    Operator.EQ: lambda value, threshold: abs(value - threshold) < 1e-6,
+    Operator.NEQ: lambda value, threshold: abs(value - threshold) >= 1e-6,
+    Operator.IN: _in,
+    Operator.NOT_IN: _not_in,
+}
+
+
+# Operators the vectorized evaluator handles, as per-group numpy comparisons
+_VECTOR_OPS: Dict[Operator, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    Operator.GT: np.greater,
+    Operator.GTE: np.greater_equal,
+    Operator.LT: np.less,
+    Operator.LTE: np.less_equal,
+    Operator.EQ: lambda values, thresholds: np.abs(values - thresholds) < 1e-6,
+    Operator.NEQ: lambda values, thresholds: np.abs(values - thresholds) >= 1e-6,
+}
+# Integer code per vectorizable operator, as used by _eval_conds
+_OP_CODES: Dict[Operator, int] = {op: code for code, op in enumerate(_VECTOR_OPS)}
+
+if HAS_NUMBA:
+
+    @njit(
+        "void(float64[:], int64[:], float64[:], int8[:], int64[:], boolean[:])",
+        cache=True,
+    )
+    def _eval_conds(gathered, cond_slot, thresholds, op_code, cond_rule, rule_ok):
+        """Clear rule_ok for every rule with a failing condition (NaN fails)."""
+        for i in range(cond_slot.size):
+            v = gathered[cond_slot[i]]
+            t = thresholds[i]
+            c = op_code[i]
+            if c == 0:
+                ok = v > t
+            elif c == 1:
+                ok = v >= t
+            elif c == 2:
+                ok = v < t
+            elif c == 3:
+                ok = v <= t
+            elif c == 4:
+                ok = abs(v - t) < 1e-6
+            else:
+                ok = abs(v - t) >= 1e-6
+            if not ok:
+                rule_ok[cond_rule[i]] = False
+
+
 class TimeUnit(Enum):
     """Time units for cooldowns and thresholds."""
 
@@ -45,57 +248,53 @@ class TimeUnit(Enum):
     SAMPLES = "samples"
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition:
     """A single condition that can be evaluated against a ParameterSnapshot."""
 
     parameter_index: int  # Index of parameter to check
     operator: Operator  # Comparison operator
-    threshold: float  # Threshold value (in normalized 0.0-1.0 range)
+    # Threshold value (in normalized 0.0-1.0 range); a set of values for IN/NOT_IN
+    threshold: Union[float, FrozenSet[float], List[float]]
     parameter_name: str = ""  # Optional parameter name for readability
     condition_type: Optional[str] = None  # Optional audio/advanced condition type
+    _cmp: Optional[Callable[[Any, Any], bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._cmp = _OP_TABLE.get(self.operator)
 
     def evaluate(self, values: Dict[int, float]) -> bool:
         """Evaluate this condition against parameter values.
 
         Args:
-            values: Dict mapping parameter_index -> normalized_value (0.0-1.0)
+            values: Dict mapping parameter_index -> normalized_value (0.0-1.0),
+                or a snapshot's ParameterValues
 
         Returns:
             True if condition is satisfied, False otherwise
         """
-        value = values.get(self.parameter_index)
-        if value is None:
+        index = self.parameter_index
+        if type(values) is ParameterValues and values.dense and type(index) is int:
+            # Direct array read; slots of unpolled parameters hold NaN
+            array = values.array
+            value = float(array[index]) if 0 <= index < len(array) else _NAN
+        else:
+            value = values.get(self.parameter_index)
+        if value is None or value != value:
             logger.warning(
-                f"Parameter index {self.parameter_index} not found in snapshot. Condition fails."
+                "Parameter index %s not found in snapshot. Condition fails.",
+                self.parameter_index,
             )
             return False
 
+        if self._cmp is None:
+            logger.error(f"Unknown operator: {self.operator}")
+            return False
+
         try:
-            if self.operator == Operator.GT:
-                return value > self.threshold
-            elif self.operator == Operator.GTE:
-                return value >= self.threshold
-            elif self.operator == Operator.LT:
-                return value < self.threshold
-            elif self.operator == Operator.LTE:
-                return value <= self.threshold
-            elif self.operator == Operator.EQ:
-                return abs(value - self.threshold) < 1e-6
-            elif self.operator == Operator.NEQ:
-                return abs(value - self.threshold) >= 1e-6
-            elif self.operator == Operator.IN:
-                # Only support list-like thresholds for IN/NOT_IN; otherwise, default to False
-                if isinstance(self.threshold, (list, tuple, set)):
-                    return value in self.threshold
-                return False
-            elif self.operator == Operator.NOT_IN:
-                if isinstance(self.threshold, (list, tuple, set)):
-                    return value not in self.threshold
-                return False
-            else:
-                logger.error(f"Unknown operator: {self.operator}")
-                return False
+            return self._cmp(value, self.threshold)
         except (TypeError, AttributeError) as e:
             logger.error(f"Error evaluating condition: {e}")
             return False
@@ -124,7 +323,7 @@ class AudioConditionType(Enum):
     BEAT_DETECTED = "beat_detected"  # Beat detected (boolean)
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioAnalysisCondition:
     """A condition that evaluates against real-time audio analysis data.
 
@@ -196,7 +395,7 @@ class AudioAnalysisCondition:
                 return bool(analysis.get("beat", False))
 
             else:
-                logger.warning(f"Unknown audio condition type: {cond_type}")
+                logger.warning("Unknown audio condition type: %s", cond_type)
                 return False
 
         except (TypeError, ValueError) as e:
@@ -213,7 +412,7 @@ class AudioAnalysisCondition:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SetParameterAction:
     """Action to set a device parameter to a specific value."""
 
@@ -224,7 +423,7 @@ class SetParameterAction:
     action_type: str = "set_parameter"  # For YAML serialization
 
 
-@dataclass
+@dataclass(slots=True)
 class TriggerClipAction:
     """Action to trigger a clip slot."""
 
@@ -233,7 +432,7 @@ class TriggerClipAction:
     action_type: str = "trigger_clip"
 
 
-@dataclass
+@dataclass(slots=True)
 class StopClipAction:
     """Action to stop a clip slot."""
 
@@ -242,7 +441,7 @@ class StopClipAction:
     action_type: str = "stop_clip"
 
 
-@dataclass
+@dataclass(slots=True)
 class SetTrackVolumeAction:
     """Action to set track volume."""
 
@@ -256,7 +455,33 @@ ActionType = Union[
 ]
 
 
-@dataclass
+# Action type -> (MCP tool name, payload builder), resolved once per Action
+_ACTION_DISPATCH: Dict[str, tuple] = {
+    "set_parameter": (
+        "set_device_parameter",
+        lambda a: {
+            "track_index": a.track_index,
+            "device_index": a.device_index,
+            "parameter_index": a.parameter_index,
+            "value": a.target_value,
+        },
+    ),
+    "trigger_clip": (
+        "fire_clip",
+        lambda a: {"track_index": a.track_index, "clip_index": a.clip_index},
+    ),
+    "stop_clip": (
+        "stop_clip",
+        lambda a: {"track_index": a.track_index, "clip_index": a.clip_index},
+    ),
+    "set_volume": (
+        "set_track_volume",
+        lambda a: {"track_index": a.track_index, "volume": a.target_value},
+    ),
+}
+
+
+@dataclass(slots=True)
 class Action:
     """An action to execute when rule conditions are met."""
 
@@ -267,6 +492,18 @@ class Action:
     clip_index: int = 0  # For clip actions
     target_value: float = 0.0  # For parameter/volume actions (normalized 0.0-1.0)
     data: Optional[Dict[str, Any]] = None  # Additional action-specific data
+    _tool_name: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _payload_factory: Optional[Callable[["Action"], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Unknown types stay unresolved and are rejected at execution time
+        self._tool_name, self._payload_factory = _ACTION_DISPATCH.get(
+            self.type, (None, None)
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert action to dictionary for execution."""
@@ -294,7 +531,11 @@ class Action:
         )
 
 
-@dataclass
+# Condition checks between re-sorts of a rule's condition evaluation order
+_REORDER_INTERVAL = 64
+
+
+@dataclass(slots=True)
 class Rule:
     """A rule that triggers actions when conditions are met."""
 
@@ -308,17 +549,30 @@ class Rule:
     )
     description: str = ""  # Optional description
     audio_conditions: List[AudioAnalysisCondition] = field(default_factory=list)  # Audio analysis conditions
-    last_triggered: float = 0.0  # Timestamp of last trigger (internal state)
+    last_triggered: float = 0.0  # time.monotonic() of last trigger (internal state)
     trigger_count: int = 0  # Number of times triggered (internal state)
+    # Adaptive short-circuit order: condition positions, most often failing first
+    _order: List[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _fails: List[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _checks: int = field(default=0, init=False, repr=False, compare=False)
 
-    def can_trigger(self) -> bool:
-        """Check if cooldown period has elapsed since last trigger."""
+    def can_trigger(self, now: Optional[float] = None) -> bool:
+        """Check if cooldown period has elapsed since last trigger.
+
+        Args:
+            now: Current time.monotonic() value, if the caller already has one
+        """
         if self.cooldown_seconds <= 0:
             return True
         if self.last_triggered == 0.0:
             return True
-        elapsed = time.time() - self.last_triggered
-        return elapsed >= self.cooldown_seconds
+        if now is None:
+            now = time.monotonic()
+        return now - self.last_triggered >= self.cooldown_seconds
 
     def evaluate(self, snapshot: ParameterSnapshot) -> bool:
         """Evaluate all conditions against a parameter snapshot.
@@ -333,27 +587,71 @@ class Rule:
             return False
 
         if not self.can_trigger():
-            logger.debug(f"Rule '{self.id}' on cooldown. Skipping.")
+            logger.debug("Rule '%s' on cooldown. Skipping.", self.id)
             return False
 
-        # Evaluate all conditions (AND logic)
-        for condition in self.conditions:
-            if not condition.evaluate(snapshot.values):
-                logger.debug(
-                    f"Rule '{self.id}' condition failed: "
-                    f"parameter {condition.parameter_index} "
-                    f"{condition.operator.value} {condition.threshold}"
-                )
-                return False
+        if not self._check_conditions(snapshot.values):
+            return False
+
+        logger.info("Rule '%s' conditions satisfied.", self.id)
+        return True
 
-        logger.info(f"Rule '{self.id}' conditions satisfied.")
+    def _evaluation_order(self) -> List[int]:
+        """Return condition positions in the order they should be checked.
+
+        Conditions are re-sorted every _REORDER_INTERVAL checks so the ones
+        that fail most often come first and end the AND early. The result
+        does not depend on the order; only which conditions get evaluated.
+        """
+        if len(self._order) != len(self.conditions):
+            self._order = list(range(len(self.conditions)))
+            self._fails = [0] * len(self.conditions)
+            self._checks = 0
+        elif self._checks >= _REORDER_INTERVAL:
+            self._resort()
+        return self._order
+
+    def _resort(self) -> bool:
+        """Re-sort the evaluation order by failure count; True if it changed."""
+        fails = self._fails
+        order = sorted(self._order, key=fails.__getitem__, reverse=True)
+        changed = order != self._order
+        if changed:
+            self._order = order
+        for pos, count in enumerate(fails):
+            fails[pos] = count // 2  # Decay old history (in place: shared)
+        self._checks = 0
+        return changed
+
+    def _check_conditions(self, values: Dict[int, float]) -> bool:
+        """Check all conditions (AND logic), ignoring enabled state and cooldown."""
+        conditions = self.conditions
+        order = self._evaluation_order()
+        self._checks += 1
+        for pos in order:
+            condition = conditions[pos]
+            if not condition.evaluate(values):
+                self._fails[pos] += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Rule '%s' condition failed: parameter %s %s %s",
+                        self.id,
+                        condition.parameter_index,
+                        condition.operator.value,
+                        condition.threshold,
+                    )
+                return False
         return True
 
-    def mark_triggered(self):
-        """Record that this rule was triggered."""
-        self.last_triggered = time.time()
+    def mark_triggered(self, now: Optional[float] = None):
+        """Record that this rule was triggered.
+
+        Args:
+            now: Current time.monotonic() value, if the caller already has one
+        """
+        self.last_triggered = time.monotonic() if now is None else now
         self.trigger_count += 1
-        logger.info(f"Rule '{self.id}' triggered (count: {self.trigger_count})")
+        logger.info("Rule '%s' triggered (count: %d)", self.id, self.trigger_count)
 
     def evaluate_audio(self, analysis: Dict[str, Any]) -> bool:
         """Evaluate audio conditions against audio analysis data.
@@ -368,7 +666,7 @@ class Rule:
             return False
 
         if not self.can_trigger():
-            logger.debug(f"Rule '{self.id}' on cooldown. Skipping.")
+            logger.debug("Rule '%s' on cooldown. Skipping.", self.id)
             return False
 
         # If no audio conditions, return True (pass-through)
@@ -379,17 +677,353 @@ class Rule:
         for condition in self.audio_conditions:
             if not condition.evaluate(analysis):
                 logger.debug(
-                    f"Rule '{self.id}' audio condition failed: "
-                    f"{condition.condition_type} vs {condition.threshold}"
+                    "Rule '%s' audio condition failed: %s vs %s",
+                    self.id,
+                    condition.condition_type,
+                    condition.threshold,
                 )
                 return False
 
-        logger.info(f"Rule '{self.id}' audio conditions satisfied.")
+        logger.info("Rule '%s' audio conditions satisfied.", self.id)
         return True
 
 
+# Source templates for conditions inlined by _specialize_check
+_INLINE_OPS: Dict[Operator, str] = {
+    Operator.GT: "{x} > {t}",
+    Operator.GTE: "{x} >= {t}",
+    Operator.LT: "{x} < {t}",
+    Operator.LTE: "{x} <= {t}",
+    Operator.EQ: "abs({x} - {t}) < 1e-6",
+    Operator.NEQ: "abs({x} - {t}) >= 1e-6",
+    Operator.IN: "{x} in {t}",
+    Operator.NOT_IN: "{x} not in {t}",
+}
+
+
+def _specialize_check(rule: Rule) -> Callable[[Any], bool]:
+    """Generate a predicate for a rule with its conditions baked in.
+
+    Indices, thresholds and operators become constants in the generated
+    code, so checking a plain {parameter_index: value} dict is a few lookups
+    and comparisons with no loop. Missing values, comparison errors and
+    debug logging defer to Rule._check_conditions, which produces the usual
+    log messages.
+    """
+    if not rule.conditions:
+        return rule._check_conditions
+
+    order = rule._evaluation_order()
+    namespace: Dict[str, Any] = {
+        "_fails": rule._fails,  # Failure counts feed Rule._resort
+        "__builtins__": {
+            "abs": abs,
+            "TypeError": TypeError,
+            "AttributeError": AttributeError,
+        },
+        "_slow": rule._check_conditions,
+        "_enabled": logger.isEnabledFor,
+        "_DEBUG": logging.DEBUG,
+    }
+
+    def literal(name: str, value: Any) -> str:
+        if type(value) in (int, float) and math.isfinite(value):
+            return repr(value)
+        namespace[name] = value
+        return name
+
+    lines = [
+        "def _check(v):",
+        "    if _enabled(_DEBUG):",
+        "        return _slow(v)",
+        "    get = v.get",
+        "    try:",
+    ]
+    for n in order:
+        condition = rule.conditions[n]
+        op, threshold = condition.operator, condition.threshold
+        if op not in _INLINE_OPS:
+            return rule._check_conditions
+        if op in (Operator.IN, Operator.NOT_IN) and not isinstance(
+            threshold, _LIST_LIKE
+        ):
+            test = "False"  # Non list-like thresholds never match
+        else:
+            test = _INLINE_OPS[op].format(x=f"x{n}", t=literal(f"t{n}", threshold))
+        key = literal(f"k{n}", condition.parameter_index)
+        lines += [
+            f"        x{n} = get({key})",
+            f"        if x{n} is None or x{n} != x{n}:",
+            "            return _slow(v)",
+            f"        if not ({test}):",
+            f"            _fails[{n}] += 1",
+            "            return False",
+        ]
+    lines += [
+        "    except (TypeError, AttributeError):",
+        "        return _slow(v)",
+        "    return True",
+    ]
+    exec("\n".join(lines), namespace)
+    return namespace["_check"]
+
+
+class _CompiledRules:
+    """Structure-of-arrays view of rule conditions for vectorized evaluation.
+
+    Numeric conditions of all rules are flattened into parallel arrays
+    (parameter slot, threshold, owning rule) grouped by operator, so one
+    numpy pass evaluates every condition and a bincount AND-reduces them
+    per rule. Rules using IN/NOT_IN or non-numeric thresholds are checked
+    one by one instead, through predicates generated by _specialize_check.
+
+    Results are cached per rule: when a snapshot lists the parameters that
+    changed since the previous snapshot evaluated here, only rules reading
+    one of them are re-checked.
+
+    Views are built lazily, by the first evaluation after the rules change
+    (not when rule sets are loaded or added), so that evaluation pays for
+    flattening and for generating the fallback predicates. The numba
+    kernel itself is compiled, or loaded from numba's cache, at import.
+    """
 
-@dataclass
+    __slots__ = (
+        "rules",
+        "n_rules",
+        "param_ids",
+        "cond_slot",
+        "thresholds",
+        "cond_rule",
+        "op_groups",
+        "op_code",
+        "fallback",
+        "_checks",
+        "_ticks",
+        "_fallback_by_index",
+        "_vector_params",
+        "_matched",
+        "_dirty",
+        "_last_ns",
+        "_param_id_array",
+        "_dense_size",
+        "_gather_map",
+        "_gather_pos",
+        "_gather_missing",
+    )
+
+    def __init__(self, rules: List[Rule]):
+        self.rules = rules
+        self.n_rules = len(rules)
+        self.fallback: List[int] = []  # Positions of non-vectorizable rules
+        self._checks: Dict[int, Callable[[Any], bool]] = {}  # position -> check
+        self._ticks = 0  # Matches since fallback rules last re-sorted conditions
+        self._fallback_by_index: Dict[Any, List[int]] = {}  # param -> positions
+
+        param_ids: Dict[int, int] = {}  # parameter index -> slot in gathered values
+        cond_slot, thresholds, cond_rule, cond_ops = [], [], [], []
+        for pos, rule in enumerate(rules):
+            if not all(
+                c.operator in _VECTOR_OPS
+                and isinstance(c.parameter_index, int)
+                and isinstance(c.threshold, (int, float))
+                for c in rule.conditions
+            ):
+                self.fallback.append(pos)
+                self._checks[pos] = _specialize_check(rule)
+                for c in rule.conditions:
+                    bucket = self._fallback_by_index.setdefault(c.parameter_index, [])
+                    bucket.append(pos)
+                continue
+            for c in rule.conditions:
+                slot = param_ids.setdefault(c.parameter_index, len(param_ids))
+                cond_slot.append(slot)
+                thresholds.append(c.threshold)
+                cond_rule.append(pos)
+                cond_ops.append(c.operator)
+
+        self.param_ids = list(param_ids)
+        self._vector_params = frozenset(param_ids)
+        self._matched: Optional[np.ndarray] = None  # Last result, per rule
+        self._dirty: set = set()  # Fallback rules skipped since their inputs changed
+        self._last_ns: Optional[int] = None  # monotonic_ns of last snapshot
+        self._param_id_array = np.array(self.param_ids, dtype=np.int64)
+        # Smallest dense array that holds every referenced parameter, if any
+        self._dense_size: Optional[int] = 0
+        if self.param_ids:
+            nonnegative = min(self.param_ids) >= 0
+            self._dense_size = max(self.param_ids) + 1 if nonnegative else None
+        self.cond_slot = np.array(cond_slot, dtype=np.int64)
+        self.thresholds = np.array(thresholds, dtype=np.float64)
+        self.cond_rule = np.array(cond_rule, dtype=np.int64)
+        self.op_code = np.array([_OP_CODES[o] for o in cond_ops], dtype=np.int8)
+        # (compare, condition positions, thresholds) for each operator in use
+        self.op_groups = []
+        for op, compare in _VECTOR_OPS.items():
+            members = np.flatnonzero([o is op for o in cond_ops])
+            if len(members):
+                self.op_groups.append((compare, members, self.thresholds[members]))
+
+        self._gather_map: Optional[Dict[int, int]] = None
+        self._gather_pos = np.empty(0, dtype=np.int64)
+        self._gather_missing = np.empty(0, dtype=bool)
+
+    def _gather(self, values: Any) -> np.ndarray:
+        """Collect referenced parameter values into one array (NaN if missing).
+
+        The result is always a contiguous float64 array, the only input
+        _eval_conds is compiled for, whatever dtype a snapshot stores.
+        """
+        if isinstance(values, ParameterValues):
+            array = values.array
+            if array.dtype != np.float64:
+                array = array.astype(np.float64)
+        if type(values) is ParameterValues and values.dense:
+            if self._dense_size is not None and self._dense_size <= len(array):
+                # Unpolled parameters are already NaN
+                return array[self._param_id_array]
+
+        if isinstance(values, ParameterValues) and len(array):
+            # Snapshots from one poller share an index map; cache positions
+            if values.index_map is not self._gather_map:
+                index_map = values.index_map
+                pos = [index_map.get(i, -1) for i in self.param_ids]
+                self._gather_pos = np.array(pos, dtype=np.int64)
+                self._gather_missing = self._gather_pos < 0
+                self._gather_map = index_map
+            gathered = array[self._gather_pos]
+            if self._gather_missing.any():
+                gathered[self._gather_missing] = np.nan
+            return gathered
+
+        nan = float("nan")
+        return np.fromiter(
+            (values.get(i, nan) for i in self.param_ids),
+            dtype=np.float64,
+            count=len(self.param_ids),
+        )
+
+    def match(
+        self, snapshot: ParameterSnapshot, eligible: Optional[List[bool]] = None
+    ) -> np.ndarray:
+        """Return a bool per rule: True where all its conditions hold.
+
+        Args:
+            snapshot: Snapshot to check
+            eligible: Optional per-rule flags; non-vectorizable rules that are
+                not eligible (disabled or cooling down) are not checked, and
+                their entries in the result are meaningless
+        """
+        values = snapshot.values
+        changed = snapshot.changed_indices
+        incremental = (
+            changed is not None
+            and self._matched is not None
+            and snapshot.previous_ns == self._last_ns
+        )
+        self._last_ns = snapshot.monotonic_ns
+
+        if not incremental:
+            matched = self._match_vector(values)
+            fallback = self.fallback
+            self._dirty.clear()
+        else:
+            matched = self._matched
+            if not changed.isdisjoint(self._vector_params):
+                previous = matched
+                matched = self._match_vector(values)
+                matched[self.fallback] = previous[self.fallback]
+            by_index = self._fallback_by_index
+            fallback = sorted(
+                {pos for i in changed if i in by_index for pos in by_index[i]}
+                | self._dirty
+            )
+
+        dirty = self._dirty
+        if fallback and isinstance(values, ParameterValues):
+            values = dict(values.items())  # One conversion for all checks
+        for pos in fallback:
+            if eligible is not None and not eligible[pos]:
+                dirty.add(pos)  # Re-check once it can trigger again
+                continue
+            matched[pos] = self._checks[pos](values)
+            dirty.discard(pos)
+        self._matched = matched
+
+        self._ticks += 1
+        if self._ticks >= _REORDER_INTERVAL:
+            # Put the most selective conditions first in the generated code
+            self._ticks = 0
+            for pos in self.fallback:
+                if self.rules[pos]._resort():
+                    self._checks[pos] = _specialize_check(self.rules[pos])
+        return matched
+
+    def _match_vector(self, values: Any) -> np.ndarray:
+        """Check all vectorizable rules (fallback rule entries are unspecified)."""
+        gathered = self._gather(values)
+        missing = np.isnan(gathered)
+        if missing.any():
+            for slot in np.flatnonzero(missing).tolist():
+                logger.warning(
+                    "Parameter index %s not found in snapshot. Condition fails.",
+                    self.param_ids[slot],
+                )
+
+        if HAS_NUMBA:
+            # One compiled pass over all conditions
+            matched = np.ones(self.n_rules, dtype=np.bool_)
+            _eval_conds(
+                gathered,
+                self.cond_slot,
+                self.thresholds,
+                self.op_code,
+                self.cond_rule,
+                matched,
+            )
+            return matched
+
+        values = gathered[self.cond_slot]
+        ok = np.zeros(len(values), dtype=bool)  # NaN compares False
+        for compare, members, thresholds in self.op_groups:
+            ok[members] = compare(values[members], thresholds)
+
+        failed = np.bincount(self.cond_rule[~ok], minlength=len(self.rules))
+        return failed == 0
+
+
+def _eligibility(rules: List[Rule], now: float) -> List[bool]:
+    """Per-rule flags: enabled and not cooling down at ``now``."""
+    return [
+        rule.enabled
+        and (
+            rule.cooldown_seconds <= 0
+            or rule.last_triggered == 0.0
+            or now - rule.last_triggered >= rule.cooldown_seconds
+        )
+        for rule in rules
+    ]
+
+
+def _triggered(
+    compiled: _CompiledRules,
+    snapshot: ParameterSnapshot,
+    eligible: List[bool],
+    out: Optional[List[Rule]] = None,
+) -> List[Rule]:
+    """Eligible rules of a compiled view whose conditions hold for snapshot.
+
+    They are appended to ``out`` (which is returned) when one is given.
+    """
+    triggered_rules = [] if out is None else out
+    for pos in np.flatnonzero(compiled.match(snapshot, eligible)).tolist():
+        if eligible[pos]:
+            rule = compiled.rules[pos]
+            logger.info("Rule '%s' conditions satisfied.", rule.id)
+            triggered_rules.append(rule)
+    return triggered_rules
+
+
+@dataclass(slots=True)
 class RuleSet:
     """A collection of rules loaded from a YAML configuration file."""
 
@@ -398,25 +1032,56 @@ class RuleSet:
     rules: List[Rule] = field(default_factory=list)
     description: str = ""
     enabled: bool = True  # Can disable entire rule set
+    _compiled: Optional[_CompiledRules] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def evaluate_all(self, snapshot: ParameterSnapshot) -> List[Rule]:
+    def _compile(self) -> _CompiledRules:
+        """Build (or rebuild) the vectorized view of this rule set's conditions.
+
+        Called automatically when ``rules`` is replaced or resized; call it
+        after editing conditions of existing rules in place.
+        """
+        self._compiled = _CompiledRules(self.rules)
+        return self._compiled
+
+    def evaluate_all(
+        self,
+        snapshot: ParameterSnapshot,
+        now: Optional[float] = None,
+        out: Optional[List[Rule]] = None,
+    ) -> List[Rule]:
         """Evaluate all rules in this rule set.
 
         Args:
             snapshot: ParameterSnapshot to evaluate against
+            now: Current time.monotonic() value for cooldowns (default: read it)
+            out: Optional list to append triggered rules to instead of
+                allocating a new one
 
         Returns:
             List of rules that should trigger (conditions + cooldown satisfied)
         """
+        if out is None:
+            out = []
         if not self.enabled:
-            return []
-
-        triggered_rules = []
-        for rule in self.rules:
-            if rule.evaluate(snapshot):
-                triggered_rules.append(rule)
-
-        return triggered_rules
+            return out
+
+        compiled = self._compiled
+        if (
+            compiled is None
+            or compiled.rules is not self.rules
+            or compiled.n_rules != len(self.rules)
+        ):
+            compiled = self._compile()
+
+        # Enabled/cooldown first, so ineligible rules never touch their conditions
+        if now is None:
+            now = time.monotonic()
+        eligible = _eligibility(self.rules, now)
+        if not any(eligible):
+            return out
+        return _triggered(compiled, snapshot, eligible, out)
 
     def evaluate_audio_all(self, analysis: Dict[str, Any]) -> List[Rule]:
         """Evaluate all rules against audio analysis data.
@@ -474,15 +1139,42 @@ class RuleEngine:
     4. Track rule statistics and handle errors gracefully
     """
 
-    def __init__(self, mcp_client=None):
+    def __init__(
+        self,
+        mcp_client=None,
+        audit_log_size: int = 10000,
+        max_action_workers: int = 1,
+        allow_dry_run: bool = False,
+    ):
         """Initialize rule engine.
 
         Args:
             mcp_client: MCP client instance for executing actions
+            audit_log_size: Maximum number of execution records to keep
+                (oldest records are dropped first)
+            max_action_workers: Number of actions from one tick that may be in
+                flight at once. Keep 1 unless the client's call_tool is
+                thread-safe. Above 1, actions run on a worker pool that lives
+                until close() (called by the controller's stop()) or until
+                the engine is garbage collected.
+            allow_dry_run: Evaluate rules even without an MCP client (rules
+                trigger and their action failures are counted). When False,
+                evaluation is skipped entirely until a client is attached.
         """
         self.mcp_client = mcp_client
+        self.allow_dry_run = allow_dry_run
+        self.max_action_workers = max_action_workers
+        self._action_pool: Optional[ThreadPoolExecutor] = None
+        self._action_pool_finalizer: Optional[weakref.finalize] = None
         self.rule_sets: List[RuleSet] = []
-        self.executed_actions: List[Dict[str, Any]] = []  # Audit log
+        self.audit_log_size = audit_log_size
+        # Compiled view over the rules of all rule sets, evaluated in one pass
+        self._flat: Optional[_CompiledRules] = None
+        self._flat_sources: List[tuple] = []  # (ruleset, rules list, length)
+        # Per-tick scratch lists, cleared and refilled instead of reallocated
+        self._tick_eligible: List[bool] = []
+        self._tick_triggered: List[Rule] = []
+        self.executed_actions: deque = deque(maxlen=audit_log_size)  # Audit log
         self.stats = {
             "total_evaluations": 0,
             "total_triggers": 0,
@@ -493,6 +1185,10 @@ class RuleEngine:
     def load_ruleset_from_yaml(self, yaml_path: Union[str, Path]) -> RuleSet:
         """Load a rule set from a YAML configuration file.
 
+        The parsed YAML is cached as JSON in the private user cache dir (see
+        _load_yaml_cached); the RuleSet and its compiled arrays are rebuilt
+        from that data on every load, which takes microseconds.
+
         Args:
             yaml_path: Path to YAML file
 
@@ -508,8 +1204,7 @@ class RuleEngine:
         if not yaml_path.exists():
             raise FileNotFoundError(f"Rule file not found: {yaml_path}")
 
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml_cached(yaml_path)
 
         return self._parse_ruleset(data, yaml_path.stem)
 
@@ -582,6 +1277,15 @@ class RuleEngine:
                     f"Valid: {[op.value for op in Operator]}"
                 )
 
+            # Membership tests hash instead of scanning the list
+            if operator in (Operator.IN, Operator.NOT_IN) and isinstance(
+                threshold, (list, tuple)
+            ):
+                try:
+                    threshold = frozenset(threshold)
+                except TypeError:
+                    pass  # Unhashable entries: keep the list
+
             condition = Condition(
                 parameter_index=param_idx,
                 operator=operator,
@@ -621,6 +1325,7 @@ class RuleEngine:
             ruleset: RuleSet to add
         """
         self.rule_sets.append(ruleset)
+        self._flat = None
         logger.info(f"Added rule set '{ruleset.id}' to engine.")
 
     def remove_ruleset(self, ruleset_id: str):
@@ -630,8 +1335,35 @@ class RuleEngine:
             ruleset_id: ID of rule set to remove
         """
         self.rule_sets = [rs for rs in self.rule_sets if rs.id != ruleset_id]
+        self._flat = None
         logger.info(f"Removed rule set '{ruleset_id}' from engine.")
 
+    def _flat_view(self) -> _CompiledRules:
+        """Return the compiled view of all rule sets, rebuilding it if stale.
+
+        Besides add_ruleset/remove_ruleset, any change to the rule sets list
+        or to a rule set's ``rules`` list (replaced or resized) triggers a
+        rebuild.
+        """
+        sources = self._flat_sources
+        if (
+            self._flat is None
+            or len(sources) != len(self.rule_sets)
+            or any(
+                source is not ruleset
+                or rules is not ruleset.rules
+                or n_rules != len(rules)
+                for (source, rules, n_rules), ruleset in zip(sources, self.rule_sets)
+            )
+        ):
+            self._flat_sources = [
+                (rs, rs.rules, len(rs.rules)) for rs in self.rule_sets
+            ]
+            self._flat = _CompiledRules(
+                [rule for rs in self.rule_sets for rule in rs.rules]
+            )
+        return self._flat
+
     def evaluate(self, snapshot: ParameterSnapshot) -> List[Dict[str, Any]]:
         """Evaluate all loaded rule sets against a parameter snapshot.
 
@@ -643,21 +1375,35 @@ class RuleEngine:
         Returns:
             List of action dictionaries that were executed
         """
+        if self.mcp_client is None and not self.allow_dry_run:
+            return []  # Nothing could be executed; skip the condition work
+
         self.stats["total_evaluations"] += 1
 
-        all_triggered_rules = []
+        # One clock read per tick, shared by every cooldown check
+        now = time.monotonic()
 
-        # Check all rule sets
+        # Check all rule sets in one pass; disabled sets make their rules
+        # ineligible instead of changing the compiled view
+        eligible = self._tick_eligible
+        eligible.clear()
         for ruleset in self.rule_sets:
-            triggered = ruleset.evaluate_all(snapshot)
-            all_triggered_rules.extend(triggered)
+            if ruleset.enabled:
+                eligible += _eligibility(ruleset.rules, now)
+            else:
+                eligible += [False] * len(ruleset.rules)
+        if not any(eligible):
+            return []
+        all_triggered_rules = self._tick_triggered
+        all_triggered_rules.clear()
+        _triggered(self._flat_view(), snapshot, eligible, all_triggered_rules)
 
         if not all_triggered_rules:
             # logger.debug("No rules triggered.")
             return []
 
         # Execute actions for triggered rules
-        executed = self._execute_triggered_rules(all_triggered_rules)
+        executed = self._execute_triggered_rules(all_triggered_rules, now)
 
         # Update statistics
         self.stats["total_triggers"] += len(all_triggered_rules)
@@ -676,6 +1422,9 @@ class RuleEngine:
         Returns:
             List of action dictionaries that were executed
         """
+        if self.mcp_client is None and not self.allow_dry_run:
+            return []  # Nothing could be executed; skip the condition work
+
         self.stats["total_evaluations"] += 1
 
         all_triggered_rules = []
@@ -699,34 +1448,69 @@ class RuleEngine:
 
 
     def _execute_triggered_rules(
-        self, triggered_rules: List[Rule]
+        self, triggered_rules: List[Rule], now: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """Execute actions for all triggered rules.
 
+        Each action is one call_tool round trip (the server has no batch
+        action tool); with max_action_workers > 1 they overlap.
+
         Args:
             triggered_rules: List of rules that should trigger
+            now: Current time.monotonic() value (default: read it)
 
         Returns:
             List of executed action descriptions
         """
         executed = []
-        current_time = time.time()
+        if now is None:
+            now = time.monotonic()
+        current_time = time.time()  # Wall-clock time for the audit log
 
         for rule in triggered_rules:
             # Mark rule as triggered (records timestamp)
-            rule.mark_triggered()
-
-            # Execute all actions
-            for action in rule.actions:
+            rule.mark_triggered(now)
+
+        jobs = [(rule, action) for rule in triggered_rules for action in rule.actions]
+        if self.max_action_workers > 1 and len(jobs) > 1 and self.mcp_client:
+            # Overlap the calls; records are still made here, in order
+            if self._action_pool is None:
+                self._action_pool = ThreadPoolExecutor(
+                    max_workers=self.max_action_workers,
+                    thread_name_prefix="rule-actions",
+                )
+                # Engines dropped without close() still release the workers
+                self._action_pool_finalizer = weakref.finalize(
+                    self, self._action_pool.shutdown, wait=False
+                )
+            futures = [
+                self._action_pool.submit(self._call_action, action)
+                for _, action in jobs
+            ]
+            for (rule, action), future in zip(jobs, futures):
                 try:
-                    result = self._execute_action(action, rule, current_time)
-                    executed.append(result)
+                    result = future.result()
+                    executed.append(
+                        self._record_execution(action, rule, current_time, result)
+                    )
                 except Exception as e:
                     logger.error(
                         f"Error executing action in rule '{rule.id}': {e}",
                         exc_info=True,
                     )
                     self.stats["errors"] += 1
+            return executed
+
+        for rule, action in jobs:
+            try:
+                result = self._execute_action(action, rule, current_time)
+                executed.append(result)
+            except Exception as e:
+                logger.error(
+                    f"Error executing action in rule '{rule.id}': {e}",
+                    exc_info=True,
+                )
+                self.stats["errors"] += 1
 
         return executed
 
@@ -750,59 +1534,48 @@ class RuleEngine:
         if not self.mcp_client:
             raise RuntimeError("MCP client not configured. Cannot execute actions.")
 
-        action.to_dict()
-        action_type = action.type
-
-        # Route to appropriate MCP tool
-        if action_type == "set_parameter":
-            result = self.mcp_client.call_tool(
-                "ableton-mcp-server",
-                "set_device_parameter",
-                {
-                    "track_index": action.track_index,
-                    "device_index": action.device_index,
-                    "parameter_index": action.parameter_index,
-                    "value": action.target_value,
-                },
-            )
-
-        elif action_type == "trigger_clip":
-            result = self.mcp_client.call_tool(
-                "ableton-mcp-server",
-                "fire_clip",
-                {"track_index": action.track_index, "clip_index": action.clip_index},
-            )
-
-        elif action_type == "stop_clip":
-            result = self.mcp_client.call_tool(
-                "ableton-mcp-server",
-                "stop_clip",
-                {"track_index": action.track_index, "clip_index": action.clip_index},
-            )
-
-        elif action_type == "set_volume":
-            result = self.mcp_client.call_tool(
-                "ableton-mcp-server",
-                "set_track_volume",
-                {"track_index": action.track_index, "volume": action.target_value},
-            )
-
-        else:
-            raise ValueError(f"Unknown action type: {action_type}")
+        result = self._call_action(action)
+        return self._record_execution(action, rule, timestamp, result)
+
+    def _call_action(self, action: Action) -> Any:
+        """Send one action to the MCP client and return the tool's result."""
+        # Route to the MCP tool resolved when the action was created
+        if action._tool_name is None:
+            raise ValueError(f"Unknown action type: {action.type}")
+        return self.mcp_client.call_tool(
+            "ableton-mcp-server",
+            action._tool_name,
+            action._payload_factory(action),
+        )
 
+    def _record_execution(
+        self, action: Action, rule: Rule, timestamp: float, result: Any
+    ) -> Dict[str, Any]:
+        """Build the execution record for a completed action and audit it."""
         execution_record = {
             "timestamp": timestamp,
             "rule_id": rule.id,
-            "action_type": action_type,
+            "action_type": action.type,
             "success": True,
             "result": result,
         }
 
         self.executed_actions.append(execution_record)
-        logger.info(f"Executed action '{action_type}' from rule '{rule.id}'")
+        logger.info("Executed action '%s' from rule '%s'", action.type, rule.id)
 
         return execution_record
 
+    def close(self) -> None:
+        """Shut down the worker threads used for concurrent actions, if any.
+
+        The pool is recreated on demand, so the engine stays usable.
+        """
+        if self._action_pool is not None:
+            self._action_pool_finalizer.detach()
+            self._action_pool.shutdown(wait=True)
+            self._action_pool = None
+            self._action_pool_finalizer = None
+
     def get_stats(self) -> Dict[str, Any]:
         """Get engine statistics."""
         return {
@@ -0,0 +1,48 @@
+"""
+Tests for Audio Analysis Benchmarks
+
+Tests for the benchmark suite and its report export.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for tests
+test_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(test_dir))
+
+import json
+
+import numpy as np
+
+from MCP_Server.audio_analysis.benchmarks import BenchmarkResult, BenchmarkSuite
+from MCP_Server.audio_analysis.benchmark_report import generate_report
+
+
+class TestBenchmarkResult:
+    """Test BenchmarkResult statistics."""
+
+    def test_from_float32_values_gives_python_floats(self):
+        """Test statistics of float32 samples are plain floats."""
+        values = np.array([1.5, 2.5, 3.5, 4.5], dtype=np.float32)
+        result = BenchmarkResult.from_values("float32", values)
+        for key, value in result.to_dict().items():
+            if key not in ("name", "samples", "metadata", "duration_seconds"):
+                assert type(value) is float, key
+        assert result.mean_value == 3.0
+
+
+class TestReportExport:
+    """Test exporting benchmark results."""
+
+    def test_cpu_benchmark_exports_to_json(self, tmp_path):
+        """Test a CPU usage benchmark (float32 samples) saves as JSON."""
+        suite = BenchmarkSuite()
+        result = suite.cpu_usage_benchmark(object(), duration_seconds=0.3)
+        suite.add_result(result)
+
+        path = tmp_path / "report.json"
+        generate_report(suite, 0.3, output_json=str(path))
+
+        data = json.loads(path.read_text())
+        assert "CPU Usage" in json.dumps(data)
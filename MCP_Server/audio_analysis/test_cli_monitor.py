@@ -14,7 +14,10 @@ from MCP_Server.audio_analysis.cli_monitor import (
     MonitorConfig,
     MonitorDisplay,
     AudioAnalysisMonitor,
+    truncate_visible,
+    visible_len,
 )
+from MCP_Server.audio_analysis.example_cli_monitor import create_mock_controller
 
 
 class TestMonitorColors(unittest.TestCase):
@@ -64,7 +67,7 @@ class TestMonitorDisplay(unittest.TestCase):
     def test_initialization(self):
         """Test display initialization."""
         self.assertEqual(self.display.config, self.config)
-        self.assertEqual(self.display._last_reresh_time, 0.0)
+        self.assertEqual(self.display._last_refresh_time, 0.0)
 
     def test_render_header(self):
         """Test section header rendering."""
@@ -106,6 +109,23 @@ class TestMonitorDisplay(unittest.TestCase):
         low_row = self.display.render_parameter_row(0, "Low", 0.2)
         self.assertIn(MonitorColors.DIM, low_row)
 
+    def test_render_parameter_row_cache_hits_hidden_digits(self):
+        """Test values differing only past display precision share a row."""
+        first = self.display.render_parameter_row(1, "Level", 0.50001, -6.0001)
+        second = self.display.render_parameter_row(1, "Level", 0.50004, -6.0004)
+        self.assertEqual(first, second)
+        self.assertEqual(self.display.cache_info()["parameter_row"].hits, 1)
+
+    def test_render_parameter_row_follows_bar_width(self):
+        """Test changing the bar width rebuilds the row formatter."""
+        fill, reset = MonitorColors.BG_GREEN, MonitorColors.RESET
+        row = self.display.render_parameter_row(0, "Width", 0.5)
+        self.assertIn(f"[{fill}{' ' * 10}{reset}{' ' * 10}]", row)
+
+        self.config.progress_bar_width = 10
+        row = self.display.render_parameter_row(0, "Width", 0.5)
+        self.assertIn(f"[{fill}{' ' * 5}{reset}{' ' * 5}]", row)
+
     def test_render_parameter_row_no_raw(self):
         """Test parameter row without raw value."""
         row = self.display.render_parameter_row(
@@ -235,18 +255,54 @@ class TestMonitorDisplay(unittest.TestCase):
         self.assertIn("RULE ENGINE", display_text)
         self.assertIn("Param 1", display_text)
 
-    @patch("builtins.print")
-    def test_update_display(self, mock_print):
+    @patch("sys.stdout")
+    def test_update_display(self, mock_stdout):
         """Test display update."""
         display_text = "Test Display"
         self.display.update_display(display_text)
 
-        # Verify print was called twice (clear + display text)
-        self.assertEqual(mock_print.call_count, 2)
+        # Verify one write with clear sequence + display text, then a flush
+        mock_stdout.write.assert_called_once_with(
+            "\033[2J\033[H" + display_text + "\n"
+        )
+        mock_stdout.flush.assert_called_once()
+
+    @patch("sys.stdout")
+    def test_update_display_redraws_changed_lines_only(self, mock_stdout):
+        """Test that later frames only rewrite rows that changed."""
+        self.display.update_display("Header\nValue: 1\nFooter")
+        mock_stdout.write.reset_mock()
+
+        self.display.update_display("Header\nValue: 2\nFooter")
+        mock_stdout.write.assert_called_once_with("\033[2;1HValue: 2\033[K\033[4;1H")
+
+        # Unchanged frame writes nothing
+        mock_stdout.write.reset_mock()
+        self.display.update_display("Header\nValue: 2\nFooter")
+        mock_stdout.write.assert_not_called()
+
+    @patch("os.write", side_effect=lambda fd, data: len(data))
+    def test_update_display_writes_to_terminal_fd(self, mock_write):
+        """Test that an attached terminal gets frames via os.write."""
+        self.display._stdout_fd = 1
+        self.display.update_display("Test Display")
+        mock_write.assert_called_once()
+        self.assertEqual(
+            bytes(mock_write.call_args[0][1]), b"\033[2J\033[HTest Display\n"
+        )
+
+        self.display.detach_terminal()
+        self.assertIsNone(self.display._stdout_fd)
+
+    def test_visible_width_ignores_color_codes(self):
+        """Test that ANSI codes don't count towards the line width."""
+        text = f"ab{MonitorColors.RED}cdef{MonitorColors.RESET}gh"
+        self.assertEqual(visible_len(text), 8)
+        self.assertEqual(truncate_visible(text, 8), text)
 
-        # Verify second call has display text
-        call_args = mock_print.call_args[0]
-        self.assertEqual(call_args[0], display_text)
+        clipped = truncate_visible(text, 4)
+        self.assertEqual(clipped, f"ab{MonitorColors.RED}cd{MonitorColors.RESET}")
+        self.assertEqual(visible_len(clipped), 4)
 
 
 class TestAudioAnalysisMonitor(unittest.TestCase):
@@ -258,9 +314,9 @@ class TestAudioAnalysisMonitor(unittest.TestCase):
         self.mock_poller = Mock()
         self.mock_rule_engine = Mock()
 
-        # Set up controller mock
-        self.mock_controller._poller = self.mock_poller
-        self.mock_controller._rule_engine = self.mock_rule_engine
+        # Set up controller mock (attribute names of AudioAnalysisController)
+        self.mock_controller.poller = self.mock_poller
+        self.mock_controller.engine = self.mock_rule_engine
         self.mock_controller.get_status.return_value = {
             "actual_rate_hz": 10.0,
             "target_rate_hz": 10.0,
@@ -314,6 +370,16 @@ class TestAudioAnalysisMonitor(unittest.TestCase):
         # Verify list is limited
         self.assertEqual(len(self.monitor._recent_triggers), max_triggers)
 
+    def test_callbacks_mark_display_dirty(self):
+        """Test that events only flag a redraw for the render thread."""
+        self.monitor._dirty.clear()
+        self.monitor.on_snapshot(Mock())
+        self.assertTrue(self.monitor._dirty.is_set())
+
+        self.monitor._dirty.clear()
+        self.monitor.on_rule_actions([{"rule_id": "rule_1", "actions": []}])
+        self.assertTrue(self.monitor._dirty.is_set())
+
     def test_toggle_debug(self):
         """Test debug toggle."""
         initial_state = self.monitor.display.config.show_debug
@@ -349,6 +415,36 @@ class TestAudioAnalysisMonitor(unittest.TestCase):
         # Cleanup
         self.monitor.stop()
 
+    def test_start_registers_snapshot_callback(self):
+        """Test that start/stop (un)register the poller snapshot callback."""
+        self.monitor.start()
+        self.mock_poller.add_callback.assert_called_once_with(self.monitor.on_snapshot)
+
+        self.monitor.stop()
+        self.mock_poller.remove_callback.assert_called_once_with(
+            self.monitor.on_snapshot
+        )
+
+    def test_start_stop_with_stub_controller(self):
+        """Test a poller without callbacks falls back to timed refresh."""
+        controller = create_mock_controller()
+        monitor = AudioAnalysisMonitor(
+            controller, config=MonitorConfig(refresh_rate_hz=20)
+        )
+
+        with patch("sys.stdout"), patch.object(
+            monitor.display, "update_display"
+        ) as update_display:
+            monitor.start()
+            self.assertFalse(monitor._snapshot_events)
+            time.sleep(0.5)
+            monitor.stop()
+
+        self.assertFalse(monitor._running)
+        self.assertEqual(len(monitor._parameter_configs), 3)
+        # Paced by refresh_rate_hz, not the once-a-second idle redraw
+        self.assertGreaterEqual(update_display.call_count, 4)
+
     def test_start_stops_immediately(self):
         """Test start/stop cycle."""
         self.monitor.start()
@@ -389,6 +485,15 @@ class TestAudioAnalysisMonitor(unittest.TestCase):
         expected_max = min(num_threads * actions_per_thread, self.monitor._max_triggers)
         self.assertLessEqual(len(self.monitor._recent_triggers), expected_max)
 
+        # Each thread's triggers stay in order (newest first), nothing torn
+        for thread_id in range(num_threads):
+            indices = [
+                int(trigger["rule_id"].rsplit("_", 1)[1])
+                for trigger in self.monitor._recent_triggers
+                if trigger["rule_id"].startswith(f"rule_{thread_id}_")
+            ]
+            self.assertEqual(indices, sorted(indices, reverse=True))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,7 +11,11 @@ from pathlib import Path
 test_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(test_dir))
 
+import json
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pytest
 
 from MCP_Server.audio_analysis.polling import ParameterConfig, ParameterSnapshot
@@ -186,6 +190,19 @@ rules: []
         assert controller.stop_time is not None
         assert controller._shutdown_requested
 
+    def test_stop_shuts_down_action_pool(self, controller):
+        """Test stopping controller releases the engine's action workers."""
+        pool = ThreadPoolExecutor(max_workers=2)
+        controller.engine._action_pool = pool
+        controller.engine._action_pool_finalizer = weakref.finalize(
+            controller.engine, pool.shutdown, wait=False
+        )
+        controller.start(register_engine=False)
+        controller.stop()
+
+        assert controller.engine._action_pool is None
+        assert pool._shutdown
+
     def test_stop_not_running(self, controller):
         """Test stopping non-running controller."""
         # Should not raise error
@@ -202,6 +219,17 @@ rules: []
         assert not status["controller"]["running"]
         assert status["controller"]["runtime_seconds"] == 0
 
+    def test_get_status_returns_new_dict(self, controller):
+        """Test that each get_status call returns an independent dict."""
+        status = controller.get_status()
+        again = controller.get_status()
+        assert again is not status
+        assert again["controller"] is not status["controller"]
+        assert again["poller"] is not status["poller"]
+
+        status["controller"]["running"] = "changed"
+        assert controller.get_status()["controller"]["running"] is False
+
     def test_get_status_while_running(self, controller):
         """Test getting status while controller is running."""
         controller.start(
@@ -233,6 +261,27 @@ rules: []
         assert values is not None
         assert values[0] == 0.4
         assert values[1] == 0.6
+        assert json.loads(json.dumps(values)) == {"0": 0.4, "1": 0.6}
+
+    def test_history_arrays(self, controller):
+        """Test reading buffered snapshots as contiguous arrays."""
+        for i in range(3):
+            controller.poller.buffer.push(
+                ParameterSnapshot(
+                    timestamp=time.time(),
+                    values={0: 0.1 * i, 1: 0.5},
+                    raw_values={0: -14.0 + i, 1: -10.0},
+                )
+            )
+
+        stamps, values = controller.poller.get_history_arrays(2)
+        assert values.shape == (2, 2)
+        assert values[:, 0].tolist() == [0.1, 0.2]
+        assert stamps[0] <= stamps[1]
+
+        _, raw = controller.poller.get_history_arrays(5, raw=True)
+        assert raw.dtype == np.float32
+        assert raw[:, 0].tolist() == [-14.0, -13.0, -12.0]
 
     def test_get_current_parameter_values_none(self, controller):
         """Test getting values when no snapshot exists."""
@@ -0,0 +1,472 @@
+"""
+Tests for Audio Analysis Polling
+
+Tests for the parameter pollers against the response shapes the Ableton MCP
+server actually returns.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path for tests
+test_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(test_dir))
+
+import numpy as np
+import pytest
+
+from MCP_Server.audio_analysis.polling import (
+    AudioAnalysisPoller,
+    CircularBuffer,
+    MultiPluginPoller,
+    ParameterConfig,
+    ParameterSnapshot,
+    _sleep_until,
+)
+
+
+class MockMCPClient:
+    """Mock MCP client answering like the Remote Script."""
+
+    def __init__(self, values, enabled=None, values_tool=True):
+        self.calls = []
+        self.values = list(values)
+        # Indices get_device_parameters lists (it skips disabled parameters)
+        self.enabled = range(len(self.values)) if enabled is None else enabled
+        self.values_tool = values_tool
+        self.error = None
+
+    def call_tool(self, tool_name: str, params: dict):
+        """Mock tool call."""
+        self.calls.append((tool_name, params))
+        if self.error is not None:
+            raise Exception(self.error)
+        name = tool_name.split("_", 1)[1]
+        if name == "get_device_parameter_values" and self.values_tool:
+            return {"device_index": params["device_index"], "values": self.values}
+        if name == "get_device_parameters":
+            return {
+                "device_name": "Analyzer",
+                "device_index": params["device_index"],
+                "parameters": [
+                    {"index": i, "name": f"P{i}", "value": self.values[i]}
+                    for i in self.enabled
+                ],
+            }
+        if name == "batch_get_device_parameter_values":
+            results = []
+            for call in params["calls"]:
+                if call["device_index"] > 0:
+                    results.append({"error": "Device index out of range"})
+                else:
+                    results.append({"device_index": 0, "values": self.values})
+            return {"results": results}
+        raise Exception(f"Unknown command: {name}")
+
+
+def make_poller(client, indices=(0, 2)):
+    """Create a poller monitoring the given parameter indices."""
+    configs = [
+        ParameterConfig(index=i, name=f"P{i}", min_value=0.0, max_value=10.0)
+        for i in indices
+    ]
+    return AudioAnalysisPoller(
+        track_index=0, device_index=0, params_to_poll=configs, mcp_client=client
+    )
+
+
+class TestParameterResponses:
+    """Test polling against the Remote Script's response shapes."""
+
+    def test_values_tool(self):
+        """Test the values-only tool is polled and normalized."""
+        poller = make_poller(MockMCPClient([1.0, 2.0, 5.0]))
+        snapshot = poller._poll_parameters()
+        assert snapshot.raw_values[0] == 1.0
+        assert snapshot.raw_values[2] == 5.0
+        assert snapshot.values[2] == pytest.approx(0.5)
+
+    def test_device_parameters_shape(self):
+        """Test the full tool's dict response is unwrapped by device index."""
+        # Parameter 1 is disabled, so the list skips it
+        client = MockMCPClient([1.0, 2.0, 5.0], enabled=[0, 2], values_tool=False)
+        poller = make_poller(client)
+        snapshot = poller._poll_parameters()
+        assert snapshot.raw_values[0] == 1.0
+        assert snapshot.raw_values[2] == 5.0
+        assert not poller._values_endpoint
+
+    def test_process_raw_accepts_response_dict(self):
+        """Test a raw get_device_parameters result builds a snapshot."""
+        poller = make_poller(None)
+        result = {
+            "device_name": "Analyzer",
+            "device_index": 0,
+            "parameters": [
+                {"index": 0, "name": "P0", "value": 4.0},
+                {"index": 2, "name": "P2", "value": 8.0},
+            ],
+        }
+        snapshot = poller._process_raw(result)
+        assert snapshot.raw_values[0] == 4.0
+        assert snapshot.raw_values[2] == 8.0
+
+    def test_transient_error_keeps_values_tool(self):
+        """Test only an unknown-command error switches tools."""
+        client = MockMCPClient([1.0, 2.0, 5.0])
+        poller = make_poller(client)
+        client.error = "Timeout waiting for Ableton"
+        assert poller._poll_parameters() is None
+        assert poller._values_endpoint
+
+        client.error = None
+        client.values_tool = False
+        assert poller._poll_parameters() is not None
+        assert not poller._values_endpoint
+
+    def test_batched_poll(self):
+        """Test one batch call publishes every device and skips failures."""
+        client = MockMCPClient([1.0, 2.0, 5.0])
+        multi = MultiPluginPoller(mcp_client=client)
+        first = make_poller(client)
+        second = make_poller(client)
+        second.device_index = 1
+        multi.add_poller("first", first)
+        multi.add_poller("second", second)
+        for poller in (first, second):
+            poller._managed = True  # Started without a thread of its own
+            poller.start()
+
+        multi._batched_poll([first, second])
+        assert len(client.calls) == 1
+        assert client.calls[0][0].endswith("batch_get_device_parameter_values")
+        assert first.latest_snapshot.raw_values[2] == 5.0
+        assert second.latest_snapshot is None
+
+    def test_batched_poll_skips_stopped_pollers(self):
+        """Test a poller stopped mid-session is neither polled nor published."""
+        client = MockMCPClient([1.0, 2.0, 5.0])
+        multi = MultiPluginPoller(mcp_client=client)
+        first = make_poller(client)
+        second = make_poller(client)
+        multi.add_poller("first", first)
+        multi.add_poller("second", second)
+        for poller in (first, second):
+            poller._managed = True
+            poller.start()
+        second.stop()
+
+        multi._batched_poll([first, second])
+        assert len(client.calls[0][1]["calls"]) == 1
+        assert first.poll_count == 1
+        assert second.poll_count == 0 and second.latest_snapshot is None
+
+    def test_batched_poll_rejects_short_response(self):
+        """Test a response missing results publishes nothing and errors."""
+        client = MockMCPClient([1.0, 2.0, 5.0])
+        client.call_tool = lambda name, params: {
+            "results": [{"device_index": 0, "values": [1.0, 2.0, 5.0]}]
+        }
+        multi = MultiPluginPoller(mcp_client=client)
+        first = make_poller(client)
+        second = make_poller(client)
+        for poller in (first, second):
+            poller._managed = True
+            poller.start()
+
+        with pytest.raises(RuntimeError, match="1 results for 2 devices"):
+            multi._batched_poll([first, second])
+        assert first.poll_count == second.poll_count == 0
+
+
+class TestSleepUntil:
+    """Test the absolute-deadline sleep used by the poll loops."""
+
+    def test_reaches_deadline(self):
+        """Test the sleep lasts until the deadline when not stopped."""
+        stop_event = threading.Event()
+        deadline = time.monotonic_ns() + 30_000_000
+        assert not _sleep_until(deadline, stop_event)
+        assert time.monotonic_ns() >= deadline
+
+    def test_stop_event_interrupts(self):
+        """Test setting the stop event ends a long sleep early."""
+        stop_event = threading.Event()
+        threading.Timer(0.02, stop_event.set).start()
+        start = time.monotonic()
+        assert _sleep_until(time.monotonic_ns() + 5_000_000_000, stop_event)
+        assert time.monotonic() - start < 1.0
+
+
+class SlowMCPClient(MockMCPClient):
+    """Mock MCP client whose responses take a fixed time."""
+
+    def __init__(self, values, delay):
+        super().__init__(values)
+        self.delay = delay
+
+    def call_tool(self, tool_name: str, params: dict):
+        """Mock tool call that blocks for the configured delay."""
+        time.sleep(self.delay)
+        return super().call_tool(tool_name, params)
+
+
+class TestPollLoop:
+    """Test the poll thread's fetch/publish pipeline."""
+
+    def test_first_fetch_published_immediately(self):
+        """Test a fetch is published in the iteration that made it."""
+        poller = make_poller(MockMCPClient([1.0, 2.0, 5.0]))
+        poller.update_interval = 1.0
+        poller.start()
+        try:
+            time.sleep(0.2)
+            assert poller.latest_snapshot is not None
+            assert poller.latest_snapshot.raw_values[2] == 5.0
+            names = [t.name for t in threading.enumerate()]
+            assert not any(name.startswith("mcp-ipc") for name in names)
+        finally:
+            poller.stop()
+
+    def test_slow_fetches_overlap_and_drain(self):
+        """Test fetches slower than the interval overlap and none are dropped."""
+        client = SlowMCPClient([1.0, 2.0, 5.0], delay=0.03)
+        poller = make_poller(client)
+        poller.update_interval = 0.01
+        poller.start()
+        time.sleep(0.3)
+        poller.stop()
+
+        assert poller.poll_count >= 3
+        # The overlapped fetch still in flight at stop is published too
+        assert poller.poll_count == len(client.calls)
+        assert poller.latest_snapshot.raw_values[0] == 1.0
+
+
+class TestSnapshotRecycling:
+    """Test that recycled snapshots never change under their readers."""
+
+    def test_history_survives_wrap_around(self):
+        """Test snapshots read from the buffer keep their values."""
+        client = MockMCPClient([1.0, 2.0, 3.0])
+        poller = AudioAnalysisPoller(
+            track_index=0,
+            device_index=0,
+            params_to_poll=[
+                ParameterConfig(index=0, name="P0", min_value=0.0, max_value=10.0)
+            ],
+            buffer_size=4,
+            mcp_client=client,
+        )
+        kept = []
+        poller.add_callback(lambda snapshot: kept.append(snapshot.copy()))
+
+        poller._publish(poller._poll_parameters())
+        history = poller.get_history(1)[0]
+        latest = poller.get_latest_snapshot()
+        closest = poller.get_historical_snapshot(0.0)
+
+        # Wrap the ring twice so the first snapshot object is refilled
+        for value in range(10):
+            client.values[0] = float(value)
+            poller._publish(poller._poll_parameters())
+
+        for snapshot in (history, latest, closest, kept[0]):
+            assert snapshot.raw_values[0] == 1.0
+            assert snapshot.values[0] == pytest.approx(0.1)
+        assert [s.raw_values[0] for s in kept[1:]] == [float(v) for v in range(10)]
+        assert [s.raw_values[0] for s in poller.get_history(4)] == [6.0, 7.0, 8.0, 9.0]
+
+
+class TestParameterValues:
+    """Test the array-backed value mappings."""
+
+    def test_values_compare_exactly_with_thresholds(self):
+        """Test stored values equal the floats they were built from."""
+        snapshot = ParameterSnapshot(
+            timestamp=time.time(), values={0: 0.7, 3: 0.1}, raw_values={0: -14.2}
+        )
+        assert snapshot.values.array.dtype == np.float64
+        assert snapshot.values[0] >= 0.7
+        assert snapshot.values[3] == 0.1
+        assert snapshot.raw_values[0] == -14.2
+
+
+class TestChangeTracking:
+    """Test dedup_epsilon and changed_indices on published snapshots."""
+
+    def test_changed_indices_and_previous_ns(self):
+        """Test each snapshot lists what changed since the last published one."""
+        client = MockMCPClient([1.0, 2.0, 5.0])
+        poller = make_poller(client)
+
+        poller._publish(poller._poll_parameters())
+        first = poller.latest_snapshot
+        assert first.changed_indices is None  # Nothing to compare with
+
+        client.values[2] = 6.0
+        poller._publish(poller._poll_parameters())
+        second = poller.latest_snapshot
+        assert second.changed_indices == frozenset({2})
+        assert second.previous_ns == first.monotonic_ns
+
+        poller._publish(poller._poll_parameters())
+        assert poller.latest_snapshot.changed_indices == frozenset()
+        assert poller.latest_snapshot.previous_ns == second.monotonic_ns
+
+    def test_dedup_epsilon_skips_near_duplicates(self):
+        """Test snapshots within dedup_epsilon are counted but not published."""
+        client = MockMCPClient([1.0, 2.0, 5.0])
+        poller = make_poller(client)
+        poller.dedup_epsilon = 0.01  # Normalized units; raw range is 0-10
+        published = []
+        poller.add_callback(lambda snapshot: published.append(snapshot.copy()))
+
+        poller._publish(poller._poll_parameters())
+        client.values[0] = 1.05  # 0.005 normalized: a duplicate
+        poller._publish(poller._poll_parameters())
+        client.values[0] = 1.5  # 0.05 normalized: a change
+        poller._publish(poller._poll_parameters())
+
+        assert poller.poll_count == 3
+        assert poller.dedup_count == 1
+        assert poller.buffer.size() == 2
+        assert [s.raw_values[0] for s in published] == [1.0, 1.5]
+        assert published[1].changed_indices == frozenset({0})
+        assert published[1].previous_ns == published[0].monotonic_ns
+
+
+class TestCircularBuffer:
+    """Test time-based reads from the snapshot ring."""
+
+    def test_get_time_range_after_wrap_around(self):
+        """Test only snapshots inside the window are returned, oldest first."""
+        buffer = CircularBuffer(max_size=4, width=1)
+        now_ns = time.monotonic_ns()
+        for age_s in (9, 7, 5, 3, 2, 1):  # Wraps the ring once
+            buffer.push(
+                ParameterSnapshot(
+                    timestamp=time.time() - age_s,
+                    values={0: float(age_s)},
+                    raw_values={0: float(age_s)},
+                    monotonic_ns=now_ns - int(age_s * 1e9),
+                )
+            )
+
+        in_window = buffer.get_time_range(2.5)
+        assert [s.raw_values[0] for s in in_window] == [2.0, 1.0]
+        assert in_window[0] is not buffer._slots[(buffer._write - 2) % 4]
+        assert len(buffer.get_time_range(60.0)) == 4
+        assert buffer.get_time_range(0.5) == []
+
+
+class TestSnapshotPool:
+    """Test that evicted snapshots are refilled instead of reallocated."""
+
+    def test_evicted_snapshot_is_refilled(self):
+        """Test the poller reuses an evicted snapshot with fresh values."""
+        client = MockMCPClient([1.0, 2.0, 5.0])
+        poller = make_poller(client)
+        poller.buffer = CircularBuffer(max_size=3, width=poller._size)
+
+        created = []
+        for value in range(4):  # Fills the pool (max_size + 1 entries)
+            client.values[0] = float(value)
+            poller._publish(poller._poll_parameters())
+            created.append(poller.latest_snapshot)
+
+        client.values[0] = 9.0
+        snapshot = poller._poll_parameters()
+        assert snapshot is created[0]
+        assert snapshot.raw_values[0] == 9.0
+        assert snapshot.values[0] == pytest.approx(0.9)
+        poller._publish(snapshot)
+
+        _, raw = poller.get_history_arrays(3, raw=True)
+        assert raw[:, 0].tolist() == [2.0, 3.0, 9.0]
+        history = poller.get_history(3)
+        assert [s.raw_values[0] for s in history] == [2.0, 3.0, 9.0]
+
+
+class TestMultiPluginPoller:
+    """Test the shared-thread schedulers of MultiPluginPoller."""
+
+    def test_scheduler_polls_each_device_at_its_rate(self):
+        """Test the deadline heap polls faster devices more often."""
+        fast_client = MockMCPClient([1.0, 2.0, 3.0])
+        slow_client = MockMCPClient([4.0, 5.0, 6.0])
+        fast = make_poller(fast_client)
+        slow = make_poller(slow_client)
+        fast.update_interval = 0.01
+        slow.update_interval = 0.05
+        multi = MultiPluginPoller()
+        multi.add_poller("fast", fast)
+        multi.add_poller("slow", slow)
+        seen = []
+        multi.add_global_callback(lambda name, snapshot: seen.append(name))
+
+        multi.start_all()
+        time.sleep(0.5)
+        multi.stop_all()
+
+        assert fast.thread is None and slow.thread is None  # One shared thread
+        assert slow.poll_count >= 4
+        assert fast.poll_count > 2 * slow.poll_count
+        assert fast.latest_snapshot.raw_values[0] == 1.0
+        assert slow.latest_snapshot.raw_values[0] == 4.0
+        assert set(seen) == {"fast", "slow"}
+
+    def test_scheduler_drops_individually_stopped_pollers(self):
+        """Test a poller stopped on its own leaves the shared schedule."""
+        first = make_poller(MockMCPClient([1.0, 2.0, 3.0]))
+        second = make_poller(MockMCPClient([1.0, 2.0, 3.0]))
+        first.update_interval = second.update_interval = 0.01
+        multi = MultiPluginPoller()
+        multi.add_poller("first", first)
+        multi.add_poller("second", second)
+
+        multi.start_all()
+        time.sleep(0.1)
+        first.stop()
+        count = first.poll_count
+        time.sleep(0.1)
+        multi.stop_all()
+
+        assert first.poll_count == count
+        assert second.poll_count > count
+
+        # Released from the manager, a poller can run on its own again
+        assert not first._managed and not second._managed
+        first.start()
+        try:
+            assert first.thread is not None
+        finally:
+            first.stop()
+
+    def test_batch_loop_uses_one_call_per_tick(self):
+        """Test batched polling publishes every device from one call."""
+        client = MockMCPClient([1.0, 2.0, 5.0])
+        first = make_poller(None)
+        second = make_poller(None)
+        first.update_interval = 0.02
+        second.update_interval = 0.05
+        multi = MultiPluginPoller(mcp_client=client)
+        multi.add_poller("first", first)
+        multi.add_poller("second", second)
+
+        multi.start_all()
+        time.sleep(0.3)
+        multi.stop_all()
+
+        ticks = len(client.calls)
+        assert ticks >= 5
+        assert all(
+            name.endswith("batch_get_device_parameter_values")
+            for name, _ in client.calls
+        )
+        assert all(len(params["calls"]) == 2 for _, params in client.calls)
+        # Ticks follow the fastest rate and publish every device each time
+        assert first.poll_count == second.poll_count == ticks
+        assert second.latest_snapshot.raw_values[2] == 5.0
@@ -16,13 +16,19 @@ from pathlib import Path
 # Add parent directory to path for module imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import gc
+import os
+import logging
 import pytest
+import threading
 import time
 from unittest.mock import Mock, MagicMock
 import tempfile
 import yaml
 
 from audio_analysis.rules import Operator, Condition, Rule, RuleSet, RuleEngine, Action
+from audio_analysis.rules import _specialize_check
+from audio_analysis import rules as rules_module
 from audio_analysis.polling import ParameterSnapshot
 
 
@@ -275,6 +281,130 @@ class TestRuleSet:
         assert rule.enabled is True
 
 
+def _snapshot(values, ns, changed=None, previous_ns=None):
+    return ParameterSnapshot(
+        timestamp=time.time(),
+        values=values,
+        raw_values=values,
+        monotonic_ns=ns,
+        changed_indices=changed,
+        previous_ns=previous_ns,
+    )
+
+
+class TestIncrementalMatching:
+    """Rule sets re-check only rules whose inputs changed."""
+
+    def setup_method(self):
+        # rule_vec is vectorized; rule_in (IN threshold) is checked one by one
+        self.rule_vec = Rule(
+            id="rule_vec",
+            name="Vector",
+            conditions=[Condition(0, Operator.GTE, 0.7)],
+            actions=[],
+        )
+        self.rule_in = Rule(
+            id="rule_in",
+            name="In",
+            conditions=[Condition(1, Operator.IN, [0.25, 0.5])],
+            actions=[],
+        )
+        self.ruleset = RuleSet(id="rs", name="RS", rules=[self.rule_vec, self.rule_in])
+
+    def _ids(self, snapshot):
+        return [rule.id for rule in self.ruleset.evaluate_all(snapshot)]
+
+    def test_unchanged_parameters_reuse_previous_results(self):
+        assert self._ids(_snapshot({0: 0.8, 1: 0.5}, 1)) == ["rule_vec", "rule_in"]
+
+        # Values differ but the snapshot says nothing changed: cached results
+        stale = _snapshot({0: 0.1, 1: 0.1}, 2, frozenset(), previous_ns=1)
+        assert self._ids(stale) == ["rule_vec", "rule_in"]
+
+        # Only parameter 1 changed: rule_in is re-checked, rule_vec is not
+        partial = _snapshot({0: 0.1, 1: 0.1}, 3, frozenset({1}), previous_ns=2)
+        assert self._ids(partial) == ["rule_vec"]
+
+        # Parameter 0 changed: the vectorized rules are re-checked
+        vector = _snapshot({0: 0.1, 1: 0.1}, 4, frozenset({0}), previous_ns=3)
+        assert self._ids(vector) == []
+
+    def test_gap_in_snapshot_chain_forces_full_evaluation(self):
+        assert self._ids(_snapshot({0: 0.8, 1: 0.5}, 1)) == ["rule_vec", "rule_in"]
+
+        # Compared against a snapshot this rule set never saw
+        skipped = _snapshot({0: 0.1, 1: 0.1}, 3, frozenset(), previous_ns=2)
+        assert self._ids(skipped) == []
+
+    def test_skipped_fallback_rule_is_rechecked_when_eligible(self):
+        assert self._ids(_snapshot({0: 0.1, 1: 0.1}, 1)) == []
+
+        # rule_in's input changes while it is disabled
+        self.rule_in.enabled = False
+        changed = _snapshot({0: 0.1, 1: 0.5}, 2, frozenset({1}), previous_ns=1)
+        assert self._ids(changed) == []
+
+        # Re-enabled with nothing changed since: still re-checked once
+        self.rule_in.enabled = True
+        same = _snapshot({0: 0.1, 1: 0.5}, 3, frozenset(), previous_ns=2)
+        assert self._ids(same) == ["rule_in"]
+
+
+class TestSpecializedCheck:
+    """Generated per-rule predicates agree with Rule._check_conditions."""
+
+    def _rule(self, *conditions):
+        return Rule(id="r", name="R", conditions=list(conditions), actions=[])
+
+    def test_matches_generic_check(self):
+        conditions = [
+            Condition(0, Operator.GT, 0.5),
+            Condition(1, Operator.LTE, 0.2),
+            Condition(2, Operator.EQ, 0.25),
+            Condition(3, Operator.NOT_IN, frozenset({0.0, 1.0})),
+            Condition(4, Operator.IN, "not a list"),  # Never matches
+        ]
+        cases = [
+            {0: 0.6, 1: 0.2, 2: 0.25, 3: 0.5},
+            {0: 0.5, 1: 0.2, 2: 0.25, 3: 0.5},
+            {0: 0.6, 1: 0.3, 2: 0.25, 3: 0.5},
+            {0: 0.6, 1: 0.2, 2: 0.2500001, 3: 0.5},
+            {0: 0.6, 1: 0.2, 2: 0.25, 3: 1.0},
+            {0: 0.6, 1: 0.2, 2: 0.25},  # Missing parameter
+            {0: float("nan"), 1: 0.2, 2: 0.25, 3: 0.5},
+        ]
+        for count in (1, 2, 3, 4, 5):
+            rule = self._rule(*conditions[:count])
+            check = _specialize_check(rule)
+            for values in cases:
+                assert check(values) == rule._check_conditions(values), (
+                    count,
+                    values,
+                )
+
+    def test_counts_failures_for_reordering(self):
+        rule = self._rule(
+            Condition(0, Operator.GT, 0.5), Condition(1, Operator.GT, 0.5)
+        )
+        check = _specialize_check(rule)
+        assert not check({0: 0.9, 1: 0.1})
+        assert not check({0: 0.9, 1: 0.2})
+        assert check({0: 0.9, 1: 0.9})
+        assert rule._fails == [0, 2]
+
+        assert rule._resort()  # The failing condition now goes first
+        check = _specialize_check(rule)
+        assert not check({0: 0.1, 1: 0.1})
+        assert rule._fails == [0, 2]  # Halved to 1, then condition 1 failed
+
+    def test_debug_logging_uses_generic_check(self, caplog):
+        rule = self._rule(Condition(0, Operator.GT, 0.5))
+        check = _specialize_check(rule)
+        with caplog.at_level(logging.DEBUG, logger="audio_analysis.rules"):
+            assert not check({0: 0.1})
+        assert "condition failed" in caplog.text
+
+
 class TestAction:
     """Test Action serialization and deserialization."""
 
@@ -366,6 +496,68 @@ class TestRuleEngine:
         finally:
             Path(yaml_path).unlink()
 
+    def test_engine_yaml_cache_kept_out_of_rules_dir(self, tmp_path, monkeypatch):
+        cache_home = tmp_path / "cache"
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+        rules_dir = tmp_path / "rules"
+        rules_dir.mkdir()
+        yaml_path = rules_dir / "rules.yaml"
+        yaml_path.write_text(yaml.dump({"id": "cached", "name": "Cached", "rules": []}))
+
+        assert self.engine.load_ruleset_from_yaml(str(yaml_path)).id == "cached"
+        assert [p.name for p in rules_dir.iterdir()] == ["rules.yaml"]
+        assert len(list(cache_home.rglob("*.json"))) == 1
+        assert self.engine.load_ruleset_from_yaml(str(yaml_path)).id == "cached"
+
+    def test_engine_yaml_cache_write_failure_is_quiet(self, tmp_path, monkeypatch):
+        # A file where the cache dir should be makes every write fail
+        blocker = tmp_path / "cache"
+        blocker.write_text("")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+        yaml_path = tmp_path / "rules.yaml"
+        yaml_path.write_text(yaml.dump({"id": "plain", "name": "Plain", "rules": []}))
+
+        assert self.engine.load_ruleset_from_yaml(str(yaml_path)).id == "plain"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["cache", "rules.yaml"]
+
+    def test_engine_yaml_cache_is_bounded(self, tmp_path, monkeypatch):
+        cache_home = tmp_path / "cache"
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+        monkeypatch.setattr(rules_module, "_RULES_CACHE_SIZE", 2)
+        for n in range(4):
+            yaml_path = tmp_path / f"rules{n}.yaml"
+            yaml_path.write_text(yaml.dump({"id": f"r{n}", "name": "R", "rules": []}))
+            assert self.engine.load_ruleset_from_yaml(str(yaml_path)).id == f"r{n}"
+
+        assert len(list(cache_home.rglob("*.json"))) == 2
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_engine_yaml_cache_ignores_shared_dir(self, tmp_path, monkeypatch):
+        cache_home = tmp_path / "cache"
+        cache_dir = cache_home / "ableton-mcp" / "rules"
+        cache_dir.mkdir(parents=True)
+        cache_dir.chmod(0o777)  # Anyone could plant entries here
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+        yaml_path = tmp_path / "rules.yaml"
+        yaml_path.write_text(yaml.dump({"id": "plain", "name": "Plain", "rules": []}))
+
+        assert self.engine.load_ruleset_from_yaml(str(yaml_path)).id == "plain"
+        assert list(cache_dir.iterdir()) == []
+
+    def test_engine_parse_rule_in_threshold_is_frozenset(self):
+        rule = self.engine._parse_rule(
+            {
+                "id": "rule1",
+                "conditions": [
+                    {"parameter_index": 0, "operator": "in", "threshold": [0.8, 0.9]}
+                ],
+                "actions": [],
+            }
+        )
+
+        assert rule.conditions[0].threshold == frozenset({0.8, 0.9})
+        assert rule.conditions[0].evaluate(self.snapshot.values) is True
+
     def test_engine_evaluate(self):
         # Add a rule set with a triggering rule
         cond = Condition(parameter_index=0, operator=Operator.GTE, threshold=0.7)
@@ -394,6 +586,84 @@ class TestRuleEngine:
         # Verify MCP client was called
         self.mcp_client.call_tool.assert_called_once()
 
+    def test_engine_runs_actions_concurrently(self):
+        # Both calls must be in flight together to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def call_tool(server_name, tool_name, params):
+            barrier.wait()
+            return {"track": params["track_index"]}
+
+        self.mcp_client.call_tool = MagicMock(side_effect=call_tool)
+        engine = RuleEngine(mcp_client=self.mcp_client, max_action_workers=2)
+        cond = Condition(parameter_index=0, operator=Operator.GTE, threshold=0.7)
+        actions = [
+            Action(type="set_volume", track_index=1, target_value=0.5),
+            Action(type="set_volume", track_index=2, target_value=0.5),
+        ]
+        rule = Rule(
+            id="test_rule", name="Test Rule", conditions=[cond], actions=actions
+        )
+        engine.add_ruleset(RuleSet(id="test_ruleset", name="Test", rules=[rule]))
+
+        try:
+            executed = engine.evaluate(self.snapshot)
+        finally:
+            engine.close()
+
+        assert [e["result"] for e in executed] == [{"track": 1}, {"track": 2}]
+        assert engine.stats["errors"] == 0
+
+    def _engine_with_action_pool(self):
+        self.mcp_client.call_tool = MagicMock(return_value={"ok": True})
+        engine = RuleEngine(mcp_client=self.mcp_client, max_action_workers=2)
+        cond = Condition(parameter_index=0, operator=Operator.GTE, threshold=0.7)
+        actions = [
+            Action(type="set_volume", track_index=1, target_value=0.5),
+            Action(type="set_volume", track_index=2, target_value=0.5),
+        ]
+        rule = Rule(
+            id="test_rule", name="Test Rule", conditions=[cond], actions=actions
+        )
+        engine.add_ruleset(RuleSet(id="test_ruleset", name="Test", rules=[rule]))
+        engine.evaluate(self.snapshot)
+        assert engine._action_pool is not None
+        return engine
+
+    def test_engine_close_shuts_down_action_pool(self):
+        engine = self._engine_with_action_pool()
+        pool = engine._action_pool
+        engine.close()
+        assert engine._action_pool is None
+        assert pool._shutdown
+
+    def test_dropped_engine_shuts_down_action_pool(self):
+        engine = self._engine_with_action_pool()
+        pool = engine._action_pool
+        del engine
+        gc.collect()
+        assert pool._shutdown
+
+    def test_engine_without_client_skips_evaluation(self):
+        cond = Condition(parameter_index=0, operator=Operator.GTE, threshold=0.7)
+        action = Action(type="set_parameter", track_index=1, target_value=0.5)
+        rule = Rule(
+            id="test_rule", name="Test Rule", conditions=[cond], actions=[action]
+        )
+        ruleset = RuleSet(id="test_ruleset", name="Test RuleSet", rules=[rule])
+
+        engine = RuleEngine()
+        engine.add_ruleset(ruleset)
+        assert engine.evaluate(self.snapshot) == []
+        assert engine.stats["total_evaluations"] == 0
+        assert rule.trigger_count == 0
+
+        dry_run_engine = RuleEngine(allow_dry_run=True)
+        dry_run_engine.add_ruleset(ruleset)
+        assert dry_run_engine.evaluate(self.snapshot) == []
+        assert dry_run_engine.stats["total_triggers"] == 1
+        assert dry_run_engine.stats["errors"] == 1
+
     def test_engine_statistics(self):
         cond = Condition(parameter_index=0, operator=Operator.GTE, threshold=0.7)
         action = Action(type="set_parameter", track_index=1, target_value=0.5)
@@ -3279,6 +3279,53 @@ def get_device_parameters(ctx: Context, track_index: int, device_index: int) ->
         return f"Error getting device parameters: {str(e)}"
 
 
+@mcp.tool()
+def get_device_parameter_values(ctx: Context, track_index: int, device_index: int) -> str:
+    """
+    Get only the current values of a device's parameters, for fast polling.
+
+    Parameters:
+    - track_index: The index of the track
+    - device_index: The index of the device on the track
+
+    Returns a JSON object {"values": [...]} with one float per device
+    parameter, in device parameter order.
+    """
+    try:
+        ableton = get_ableton_connection()
+        result = ableton.send_command(
+            "get_device_parameter_values",
+            {"track_index": track_index, "device_index": device_index},
+        )
+        return json.dumps(result)
+    except Exception as e:
+        logger.error(f"Error getting device parameter values: {str(e)}")
+        return f"Error getting device parameter values: {str(e)}"
+
+
+@mcp.tool()
+def batch_get_device_parameter_values(ctx: Context, calls: List[Dict[str, int]]) -> str:
+    """
+    Get the parameter values of several devices in a single round trip.
+
+    Parameters:
+    - calls: List of {"track_index": int, "device_index": int} entries
+
+    Returns a JSON object {"results": [...]} with one entry per call, in order.
+    Each entry is {"values": [...]} like get_device_parameter_values, or
+    {"error": "..."} if that device could not be read.
+    """
+    try:
+        ableton = get_ableton_connection()
+        result = ableton.send_command(
+            "batch_get_device_parameter_values", {"calls": calls}
+        )
+        return json.dumps(result)
+    except Exception as e:
+        logger.error(f"Error getting device parameter values: {str(e)}")
+        return f"Error getting device parameter values: {str(e)}"
+
+
 @mcp.tool()
 def set_device_parameter(
     ctx: Context,